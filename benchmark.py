@@ -0,0 +1,310 @@
+"""
+Load benchmark of the booking flow.
+
+Seeds a catalogue, then drives the app with concurrent clients through a mix of searches, showings pages, bookings,
+cancellations, history pages and exports, and reports throughput and latency percentiles per route.
+
+    python benchmark.py --storage memory --clients 8 --duration 30 --output results.json
+
+Use --storage neo4j to run against the local database configured in db_creds.py. Seeded data is added to whatever
+is already there, so use an empty database.
+"""
+from datetime import datetime, timedelta
+from threading import Thread, Barrier
+from urllib.parse import quote
+from pytz import utc
+import subprocess
+import random
+import click
+import json
+import time
+import os
+
+# relative frequency of each route in the request mix
+DEFAULT_MIX = {
+    "search": 30,
+    "showings": 30,
+    "book": 15,
+    "cancel": 5,
+    "history": 15,
+    "export": 5
+}
+
+# words movie titles and descriptions are made of, so searches have realistic numbers of matches
+WORDS = ("night", "day", "return", "star", "lost", "city", "dark", "king", "love", "war", "last", "ghost", "river",
+         "secret", "summer", "winter", "house", "road", "dream", "fire", "iron", "silver", "empire", "garden")
+
+PASSWORD = "benchmark"
+
+# showings start at these hours of each day in every hall, so none of them collide
+SLOT_HOURS = (10, 13, 16, 19, 22)
+
+
+def percentile(latencies, p):
+    """
+    :param latencies: sorted list of float
+    :param p: float between 0 and 100
+    :return: float nearest-rank percentile, or None if there are no latencies
+    """
+    if not latencies:
+        return None
+
+    rank = max(1, -(-len(latencies) * p // 100))
+    return latencies[int(rank) - 1]
+
+
+def seed(storage, rng, movies, halls, seats, days, customers, bookings):
+    """
+    Create a catalogue to benchmark against.
+    :param storage: storage.Storage
+    :param rng: random.Random
+    :return: dict of what was created, used to build requests
+    """
+    from helpers import hash_password
+    from importer import programme_row
+
+    staff = storage.create_staff("bench-staff", hash_password(PASSWORD), "Bench", "Staff")
+
+    for hall in range(1, halls + 1):
+        storage.create_hall(hall, seats)
+
+    # every hall has the same slots, starting tomorrow; each hall's are dealt round-robin to the movies shown in it
+    first_day = (datetime.now(tz=utc) + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    slots = [first_day + timedelta(days=day, hours=hour) for day in range(days) for hour in SLOT_HOURS]
+
+    titles = []
+    programme = []
+    for i in range(movies):
+        title = " ".join(rng.sample(WORDS, 2)).title() + " {n}".format(n=i + 1)
+        description = " ".join(rng.choice(WORDS) for _ in range(12))
+        hall = i % halls + 1
+        movies_in_hall = len(range(hall - 1, movies, halls))
+        showtimes = slots[i // halls::movies_in_hall]
+        titles.append(title)
+        programme.append(programme_row(title, description, rng.randint(80, 150), hall, seats, showtimes))
+
+    unscheduled = sum(1 for row in programme if not row["showings"])
+    if unscheduled:
+        click.echo("Warning: {n} of {movies} movies have no showings; use more days or halls, or fewer movies."
+                   .format(n=unscheduled, movies=movies), err=True)
+
+    storage.add_showings(staff.uuid, programme)
+
+    showings = [(row["title"], show["uuid"]) for row in programme for show in row["showings"]]
+    if not showings:
+        raise click.ClickException("No showings were seeded; use more days or fewer movies.")
+
+    usernames = []
+    for i in range(customers):
+        customer = storage.register_customer("bench-{n}".format(n=i), hash_password(PASSWORD), "Bench",
+                                             "Customer {n}".format(n=i))
+        usernames.append(customer.username)
+
+        for _ in range(bookings):
+            title, uuid = rng.choice(showings)
+            storage.book(title, uuid, customer.uuid, [rng.randint(1, seats)])
+
+    dates = sorted(set(start.strftime("%d/%m/%y") for start in slots))
+
+    return {"titles": titles, "showings": showings, "customers": usernames, "dates": dates, "seats": seats}
+
+
+class Client(Thread):
+    """
+    One simulated user, with its own session, sending requests until the benchmark ends.
+    """
+
+    def __init__(self, app, catalogue, mix, rng, barrier, deadline, max_requests):
+        super().__init__(daemon=True)
+        self.app = app
+        self.catalogue = catalogue
+        self.routes = list(mix)
+        self.weights = [mix[route] for route in self.routes]
+        self.rng = rng
+        self.barrier = barrier
+        self.deadline = deadline
+        self.max_requests = max_requests
+
+        self.customer = app.test_client()
+        self.staff = app.test_client()
+        self.booked = []  # (title, showing uuid, seat) booked by this client and not yet cancelled
+        self.latencies = {route: [] for route in self.routes}
+        self.errors = {route: 0 for route in self.routes}
+
+    def login(self, username):
+        self.customer.post("/login", data={"username": username, "password": PASSWORD})
+        self.staff.post("/admin", data={"username": "bench-staff", "password": PASSWORD})
+
+    def run(self):
+        self.login(self.rng.choice(self.catalogue["customers"]))
+        self.barrier.wait()
+
+        sent = 0
+        while time.perf_counter() < self.deadline() and (not self.max_requests or sent < self.max_requests):
+            route = self.rng.choices(self.routes, self.weights)[0]
+
+            start = time.perf_counter()
+            try:
+                status = getattr(self, route)()
+            except Exception:
+                status = 500
+            elapsed = time.perf_counter() - start
+
+            self.latencies[route].append(elapsed)
+            if status >= 500:
+                self.errors[route] += 1
+            sent += 1
+
+    def fetch(self, client, method, url, **kwargs):
+        response = client.open(url, method=method, **kwargs)
+        response.get_data()  # read streamed bodies, which are part of the cost of the request
+        response.close()
+        return response.status_code
+
+    def search(self):
+        if self.rng.random() < 0.2:
+            query = self.rng.choice(self.catalogue["dates"])
+        else:
+            query = self.rng.choice(WORDS)[:self.rng.randint(2, 5)]
+        return self.fetch(self.customer, "GET", "/search", query_string={"q": query})
+
+    def showings(self):
+        title = self.rng.choice(self.catalogue["titles"])
+        return self.fetch(self.customer, "GET", "/{title}/showings".format(title=quote(title)))
+
+    def book(self):
+        title, uuid = self.rng.choice(self.catalogue["showings"])
+        url = "/{title}/{uuid}/book".format(title=quote(title), uuid=uuid)
+
+        # most customers look at the seats before booking
+        self.fetch(self.customer, "GET", url)
+
+        seat = self.rng.randint(1, self.catalogue["seats"])
+        status = self.fetch(self.customer, "POST", url, data={"book-seat": str(seat)})
+
+        # a summary page means the seat was booked; taken seats redirect back to the booking page
+        if status == 200:
+            self.booked.append((title, uuid, seat))
+
+        return status
+
+    def cancel(self):
+        if not self.booked:
+            return self.history()
+
+        title, uuid, seat = self.booked.pop(self.rng.randrange(len(self.booked)))
+        return self.fetch(self.customer, "GET", "/cancel/{uuid}/{seat}".format(uuid=uuid, seat=seat))
+
+    def history(self):
+        return self.fetch(self.customer, "GET", "/history")
+
+    def export(self):
+        export_format = self.rng.choice(("csv", "ndjson", None))
+        query_string = {"format": export_format} if export_format else {}
+        return self.fetch(self.staff, "GET", "/export", query_string=query_string)
+
+
+def revision():
+    """
+    :return: str git commit being benchmarked, or None outside a git checkout
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@click.command()
+@click.option("--storage", "backend", type=click.Choice(["memory", "neo4j"]), default="memory",
+              help="Run against the in-memory stand-in or the local Neo4j database.")
+@click.option("--clients", default=8, help="Number of concurrent clients.")
+@click.option("--duration", default=30.0, help="Seconds to run for.")
+@click.option("--requests", "max_requests", default=0, help="Stop each client after this many requests (0: no limit).")
+@click.option("--movies", default=200)
+@click.option("--halls", default=10)
+@click.option("--seats", default=120, help="Seats per hall.")
+@click.option("--days", default=14, help="Days of showings to seed.")
+@click.option("--customers", default=100)
+@click.option("--bookings", default=5, help="Bookings to seed per customer.")
+@click.option("--mix", "mix_json", default=None,
+              help="JSON object of route weights, e.g. '{\"search\": 1, \"book\": 1}'.")
+@click.option("--seed", "random_seed", default=1, help="Random seed, so runs are reproducible.")
+@click.option("--output", type=click.Path(dir_okay=False), default=None, help="Save results to this JSON file.")
+def main(backend, clients, duration, max_requests, movies, halls, seats, days, customers, bookings, mix_json,
+         random_seed, output):
+    """
+    Benchmark the booking flow.
+    """
+    mix = json.loads(mix_json) if mix_json else DEFAULT_MIX
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise click.BadParameter("Unknown routes: {routes}".format(routes=", ".join(sorted(unknown))))
+
+    # the app picks its storage when it is imported
+    os.environ["THEATRE_STORAGE"] = backend
+    from app import app, storage
+
+    rng = random.Random(random_seed)
+    started = time.perf_counter()
+    catalogue = seed(storage, rng, movies, halls, seats, days, customers, bookings)
+    click.echo("Seeded {movies} movies, {showings} showings and {customers} customers in {t:.1f}s."
+               .format(movies=movies, showings=len(catalogue["showings"]), customers=customers,
+                       t=time.perf_counter() - started), err=True)
+
+    # clients log in, then all start together
+    end = []
+    barrier = Barrier(clients + 1, action=lambda: end.append(time.perf_counter() + duration))
+    workers = [Client(app, catalogue, mix, random.Random(random_seed * 1000 + i), barrier, lambda: end[0],
+                      max_requests) for i in range(clients)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    routes = {}
+    for route in mix:
+        latencies = sorted(latency for worker in workers for latency in worker.latencies[route])
+        routes[route] = {
+            "requests": len(latencies),
+            "errors": sum(worker.errors[route] for worker in workers),
+            "throughput": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+            "p95_ms": percentile(latencies, 95) * 1000 if latencies else None,
+            "p99_ms": percentile(latencies, 99) * 1000 if latencies else None
+        }
+
+    total = sum(route["requests"] for route in routes.values())
+    results = {
+        "revision": revision(),
+        "time": datetime.now(tz=utc).isoformat(),
+        "config": {"storage": backend, "clients": clients, "duration": duration, "requests": max_requests,
+                   "movies": movies, "halls": halls, "seats": seats, "days": days, "customers": customers,
+                   "bookings": bookings, "mix": mix, "seed": random_seed},
+        "elapsed": elapsed,
+        "requests": total,
+        "throughput": total / elapsed,
+        "routes": routes
+    }
+
+    click.echo("{route:<10} {requests:>8} {errors:>7} {rps:>9} {p50:>9} {p95:>9} {p99:>9}"
+               .format(route="route", requests="requests", errors="errors", rps="req/s", p50="p50 ms",
+                       p95="p95 ms", p99="p99 ms"))
+    for route, result in routes.items():
+        click.echo("{route:<10} {requests:>8} {errors:>7} {rps:>9.1f} {p50:>9} {p95:>9} {p99:>9}".format(
+            route=route, requests=result["requests"], errors=result["errors"], rps=result["throughput"],
+            **{key: "-" if result[key + "_ms"] is None else "{ms:.1f}".format(ms=result[key + "_ms"])
+               for key in ("p50", "p95", "p99")}))
+    click.echo("{total} requests in {t:.1f}s, {rps:.1f} req/s".format(total=total, t=elapsed, rps=total / elapsed))
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
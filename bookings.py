@@ -0,0 +1,130 @@
+from threading import Condition, Lock
+from time import sleep
+
+
+class Ticket(object):
+    """
+    A booking request waiting in a BookingQueue.
+    """
+
+    __slots__ = ("request", "seats", "done", "result", "error")
+
+    def __init__(self, request):
+        self.request = request
+        self.seats = set(request[2])
+        self.done = False
+        self.result = None
+        self.error = None
+
+
+class Lane(object):
+    """
+    Booking requests waiting for one showing.
+    """
+
+    __slots__ = ("condition", "pending", "leader", "users")
+
+    def __init__(self):
+        self.condition = Condition(Lock())
+        self.pending = []  # Tickets, oldest first
+        self.leader = False  # True while a request is collecting and writing batches
+        self.users = 0
+
+
+class BookingQueue(object):
+    """
+    Group commit of bookings of the same showing. The first request to arrive waits window seconds for others to
+    join it, then writes them all with a single Storage.book_many() call, so the showing's lock is taken once per
+    batch instead of once per request. Requests claiming seats already claimed earlier in the batch wait for the
+    next one, so every request still gets its own result, exactly as if they had been booked one at a time.
+    """
+
+    def __init__(self, storage, window=0.005, max_batch=100):
+        """
+        :param storage: storage.Storage
+        :param window: float seconds a batch waits for requests to join it
+        :param max_batch: int maximum number of requests written together
+        """
+        self.storage = storage
+        self.window = window
+        self.max_batch = max_batch
+        self.lanes = {}  # Showing uuid -> Lane
+        self.lock = Lock()
+
+    def book(self, title, s_uuid, c_uuid, seats):
+        """
+        Book seats, waiting for other requests for the same showing to be written with them.
+        :return: dict or None, see Storage.book()
+        """
+        with self.lock:
+            lane = self.lanes.get(s_uuid)
+            if lane is None:
+                lane = self.lanes[s_uuid] = Lane()
+            lane.users += 1
+
+        try:
+            return self._book(lane, s_uuid, Ticket((title, c_uuid, seats)))
+        finally:
+            with self.lock:
+                lane.users -= 1
+                if not lane.users:
+                    del self.lanes[s_uuid]
+
+    def _book(self, lane, s_uuid, ticket):
+        with lane.condition:
+            lane.pending.append(ticket)
+
+            # followers wait for a leader to write their request; one of them leads when the leader is done.
+            while not ticket.done and lane.leader:
+                lane.condition.wait()
+
+            if not ticket.done:
+                lane.leader = True
+
+        if not ticket.done:
+            sleep(self.window)
+
+            try:
+                while not ticket.done:
+                    with lane.condition:
+                        batch = self._take_batch(lane)
+
+                    try:
+                        results = self.storage.book_many(s_uuid, [t.request for t in batch])
+                    except Exception as e:
+                        results = [None] * len(batch)
+                        for t in batch:
+                            t.error = e
+
+                    with lane.condition:
+                        for t, result in zip(batch, results):
+                            t.result = result
+                            t.done = True
+                        lane.condition.notify_all()
+            finally:
+                with lane.condition:
+                    lane.leader = False
+                    lane.condition.notify_all()
+
+        if ticket.error:
+            raise ticket.error
+
+        return ticket.result
+
+    def _take_batch(self, lane):
+        """
+        Remove the oldest requests which don't claim the same seats as each other from the lane.
+        Must be called holding lane.condition.
+        :return: list of Ticket, never empty while requests are pending
+        """
+        batch, waiting = [], []
+        claimed = set()
+        for ticket in lane.pending:
+            if len(batch) < self.max_batch and claimed.isdisjoint(ticket.seats):
+                claimed |= ticket.seats
+                batch.append(ticket)
+            else:
+                waiting.append(ticket)
+
+        lane.pending = waiting
+        return batch
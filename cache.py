@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class LRUCache(object):
+    """
+    Bounded, thread safe mapping which evicts the least recently used entry when full. Entries also expire ttl
+    seconds after they were stored, so results cached by one worker don't outlive writes made by another for long.
+    """
+
+    def __init__(self, maxsize=256, ttl=None):
+        """
+        :param maxsize: int maximum number of entries
+        :param ttl: float seconds an entry stays valid for, or None to keep entries until evicted
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expiry time, value), least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None or (entry[0] is not None and entry[0] <= monotonic()):
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return default
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+
+        with self.lock:
+            self.entries[key] = (expires, value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def evict(self, predicate):
+        """
+        Remove every entry whose key matches.
+        :param predicate: function taking a key, returning bool
+        """
+        with self.lock:
+            for key in [key for key in self.entries if predicate(key)]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
@@ -0,0 +1,179 @@
+from neomodel import db
+from neo4j.v1 import GraphDatabase, basic_auth, READ_ACCESS, WRITE_ACCESS
+from threading import Lock, local
+import queries
+import os
+
+
+class ConnectionPool(object):
+    """
+    Connections to Neo4j shared by every thread of a worker process. Reads and writes have a driver each, so each has
+    its own pool: browsing can take every read connection without making a booking wait for one. With routing, read
+    sessions go to a causal cluster's read replicas and write sessions to its leader; without it, both go to the one
+    server, which is how a local database is used. Replicas may lag behind the leader, so with routing, read sessions
+    of a request wait for the bookmark of the same user's last write, passed to begin(). Bookmarks are only returned
+    by committing an explicit transaction and only sent when beginning one, so routed sessions run every statement in
+    a transaction of its own, see TransactionalSession.
+    """
+
+    def __init__(self, address, username, password, routing=False, pool_size=50, read_pool_size=None, lifetime=3600,
+                 acquisition_timeout=60, encrypted=False, driver=GraphDatabase.driver):
+        """
+        :param address: str host:port of the database, or of any core server of a cluster when routing
+        :param routing: bool whether to route sessions across a causal cluster
+        :param pool_size: int maximum number of connections to each server for writes
+        :param read_pool_size: int maximum number of connections to each server for reads, pool_size if None
+        :param lifetime: float seconds after which a connection is closed instead of being reused
+        :param acquisition_timeout: float seconds a session waits for a free connection before failing
+        :param driver: function creating a driver, called like GraphDatabase.driver(), e.g. to use a stand-in
+        """
+        self.uri = "{scheme}://{address}".format(scheme="bolt+routing" if routing else "bolt", address=address)
+        self.routing = routing
+        self.auth = basic_auth(username, password)
+        self.encrypted = encrypted
+        self.pool_sizes = {WRITE_ACCESS: pool_size, READ_ACCESS: read_pool_size or pool_size}
+        self.lifetime = lifetime
+        self.acquisition_timeout = acquisition_timeout
+        self.create_driver = driver
+
+        self.drivers = {}  # access mode -> driver
+        self.pid = None  # process the drivers were created in
+        self.lock = Lock()
+        self.local = local()
+
+    @property
+    def reading(self):
+        """
+        Whether the current thread's sessions are read-only.
+        """
+        return getattr(self.local, "reading", False)
+
+    @reading.setter
+    def reading(self, value):
+        self.local.reading = value
+
+    def begin(self, reading, bookmark=None):
+        """
+        Set up the current thread's sessions for a request.
+        :param reading: bool whether the request only reads
+        :param bookmark: str bookmark of the user's last write, from last_bookmark(), for read sessions to wait for
+        """
+        self.local.reading = reading
+        self.local.bookmark = bookmark if self.routing else None
+
+        # write sessions opened by the request, to take their bookmark from; only replicas need bookmarks
+        self.local.writes = [] if self.routing else None
+
+    def last_bookmark(self):
+        """
+        :return: str bookmark of the last write session the current request opened, or None
+        """
+        for session in reversed(getattr(self.local, "writes", None) or []):
+            bookmark = session.last_bookmark()
+            if bookmark:
+                return bookmark
+
+        return None
+
+    def driver(self, access_mode):
+        """
+        :param access_mode: READ_ACCESS or WRITE_ACCESS
+        :return: the driver for access_mode in this process
+        """
+        with self.lock:
+            # sockets can't be shared with forked workers, so each process creates its own drivers.
+            if self.pid != os.getpid():
+                self.drivers = {}
+                self.pid = os.getpid()
+
+            if access_mode not in self.drivers:
+                self.drivers[access_mode] = self.create_driver(
+                    self.uri, auth=self.auth, encrypted=self.encrypted,
+                    max_connection_pool_size=self.pool_sizes[access_mode],
+                    max_connection_lifetime=self.lifetime,
+                    connection_acquisition_timeout=self.acquisition_timeout)
+
+            return self.drivers[access_mode]
+
+    def session(self, access_mode=None):
+        """
+        :param access_mode: READ_ACCESS or WRITE_ACCESS, or None for READ_ACCESS while the thread is reading
+        :return: neo4j Session
+        """
+        if access_mode is None:
+            access_mode = READ_ACCESS if self.reading else WRITE_ACCESS
+
+        bookmark = getattr(self.local, "bookmark", None) if access_mode == READ_ACCESS else None
+        if bookmark:
+            session = self.driver(access_mode).session(access_mode=access_mode, bookmark=bookmark)
+        else:
+            session = self.driver(access_mode).session(access_mode=access_mode)
+
+        if self.routing:
+            session = TransactionalSession(session)
+
+        writes = getattr(self.local, "writes", None)
+        if access_mode == WRITE_ACCESS and writes is not None:
+            writes.append(session)
+
+        return session
+
+    def warm(self, connections):
+        """
+        Open connections to the database before requests need them, so the first requests after a worker starts
+        don't wait for handshakes and authentication.
+        :param connections: int number of connections to open for reads, and for writes
+        """
+        for access_mode in (WRITE_ACCESS, READ_ACCESS):
+            sessions = [self.session(access_mode) for i in range(connections)]
+            try:
+                # transactions keep their connection until they are closed, so each session opens a different one.
+                for session in sessions:
+                    session.begin_transaction().run(queries.PING).consume()
+            finally:
+                for session in sessions:
+                    session.close()
+
+    def install(self):
+        """
+        Make neomodel, and everything else using db.driver, connect through this pool. db is a threading.local which
+        connects each thread on its first query, so set_connection is replaced on its class rather than on db itself.
+        """
+        pool = self
+
+        def set_connection(database, url):
+            database.driver = pool
+            database.url = url
+            database._pid = os.getpid()
+            database._active_transaction = None
+
+        type(db).set_connection = set_connection
+
+
+class TransactionalSession(object):
+    """
+    A neo4j Session whose run() commits each statement in an explicit transaction, as neomodel's db.cypher_query()
+    runs its statements in auto-commit transactions, which neither wait for a bookmark nor return one. Records are
+    buffered when the transaction commits, before run() returns. Everything else is passed on to the session.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def run(self, statement, parameters=None, **kwparameters):
+        """
+        :return: neo4j StatementResult, holding every record
+        """
+        with self.session.begin_transaction() as transaction:
+            result = transaction.run(statement, parameters, **kwparameters)
+
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.session.close()
@@ -0,0 +1,155 @@
+from collections import deque, OrderedDict
+from threading import Condition, Lock
+import json
+
+# number of recent events kept per showing, so reconnecting listeners can catch up on what they missed
+EVENT_HISTORY = 64
+
+# showings whose events are kept; channels without listeners are dropped, oldest first, beyond this
+MAX_CHANNELS = 1024
+
+# listeners at once, over every showing. Each stream keeps a worker thread (or greenlet) busy while it is open.
+MAX_LISTENERS = 256
+
+
+class Channel(object):
+    """
+    Recent seat changes of one showing, numbered in the order they were published.
+    """
+
+    __slots__ = ("condition", "events", "sequence", "listeners")
+
+    def __init__(self, history):
+        self.condition = Condition(Lock())
+        self.events = deque(maxlen=history)  # (int sequence number, dict event)
+        self.sequence = 0
+        self.listeners = 0
+
+    def pending(self, after, version):
+        """
+        Events a listener hasn't seen yet. Must be called holding self.condition.
+        :param after: int sequence number of the last event seen, or None for a listener which has seen none
+        :param version: int Showing.version the listener's diagram shows, or None
+        :return: list of (int, dict), or None if events the listener needs were already dropped.
+        """
+        if after is None:
+            return [(sequence, event) for sequence, event in self.events
+                    if version is not None and event["version"] > version]
+
+        # a sequence number from the future is from a channel which has since been dropped, or from another worker.
+        if after > self.sequence or (self.events and after < self.events[0][0] - 1):
+            return None
+
+        return [(sequence, event) for sequence, event in self.events if sequence > after]
+
+
+class SeatEvents(object):
+    """
+    In-process publish/subscribe hub of booked and released seats, one channel per showing. Listeners block on
+    their channel's condition, so idle connections use no CPU until a seat changes, and one notify wakes them all.
+    Each listener does hold a thread while it waits, so the app must be served by threaded or gevent workers, and
+    at most max_listeners listen at once. Only changes made by this process are seen.
+    """
+
+    def __init__(self, history=EVENT_HISTORY, max_channels=MAX_CHANNELS, max_listeners=MAX_LISTENERS):
+        self.history = history
+        self.max_channels = max_channels
+        self.max_listeners = max_listeners
+        self.channels = OrderedDict()  # Showing uuid -> Channel, least recently used first
+        self.listeners = 0
+        self.lock = Lock()  # guards channels and every listener count
+
+    def _channel(self, showing_uuid):
+        """
+        Must be called holding self.lock.
+        """
+        channel = self.channels.get(showing_uuid)
+        if channel is None:
+            channel = self.channels[showing_uuid] = Channel(self.history)
+        self.channels.move_to_end(showing_uuid)
+
+        if len(self.channels) > self.max_channels:
+            idle = [uuid for uuid, c in self.channels.items() if not c.listeners]
+            for uuid in idle[:len(self.channels) - self.max_channels]:
+                del self.channels[uuid]
+
+        return channel
+
+    def channel(self, showing_uuid):
+        with self.lock:
+            return self._channel(showing_uuid)
+
+    def acquire(self, showing_uuid):
+        """
+        Register a listener of a showing. Its channel is counted as listened to as soon as it is found, so it can't
+        be dropped before the listener waits on it. Every acquired channel must be passed to release().
+        :param showing_uuid: str
+        :return: Channel, or None if max_listeners are listening already
+        """
+        with self.lock:
+            if self.listeners >= self.max_listeners:
+                return None
+
+            channel = self._channel(showing_uuid)
+            channel.listeners += 1
+            self.listeners += 1
+
+        return channel
+
+    def release(self, channel):
+        with self.lock:
+            channel.listeners -= 1
+            self.listeners -= 1
+
+    def publish(self, showing_uuid, version, seats, reserved):
+        """
+        :param showing_uuid: str
+        :param version: int Showing.version after the change
+        :param seats: list of int seat numbers
+        :param reserved: bool True if the seats were booked, False if they were released
+        """
+        channel = self.channel(showing_uuid)
+        with channel.condition:
+            channel.sequence += 1
+            channel.events.append((channel.sequence, {"version": version, "seats": list(seats),
+                                                      "reserved": reserved}))
+            channel.condition.notify_all()
+
+    def listen(self, channel, after=None, version=None, timeout=15.0):
+        """
+        Wait for seat changes.
+        :param channel: Channel from acquire()
+        :param after: int sequence number of the last event received, e.g. from the Last-Event-ID header
+        :param version: int Showing.version the listener's diagram shows, for changes made since it was drawn
+        :param timeout: float seconds to wait before yielding nothing, so the caller can send a keep-alive
+        :return: generator of lists of (int sequence number, dict event), or None if the listener has missed
+                 changes and must reload the whole diagram.
+        """
+        with channel.condition:
+            if after is None:
+                # events published from now on are the only ones which weren't on the diagram
+                pending = channel.pending(None, version)
+                after = channel.sequence - len(pending)
+
+        while True:
+            with channel.condition:
+                pending = channel.pending(after, version)
+                if pending == []:
+                    channel.condition.wait(timeout)
+                    pending = channel.pending(after, version)
+
+            if pending:
+                after = pending[-1][0]
+            yield pending
+
+            if pending is None:
+                return
+
+
+def format_events(events):
+    """
+    :param events: list of (int, dict), as yielded by SeatEvents.listen()
+    :return: str Server-Sent Events message
+    """
+    return "".join("id: {id}\nevent: seats\ndata: {data}\n\n".format(id=sequence, data=json.dumps(event))
+                   for sequence, event in events)
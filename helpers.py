@@ -1,8 +1,13 @@
 from functools import wraps
+from bisect import bisect_left, bisect_right
 from flask import session, redirect, url_for, request
 from hashlib import sha256
 from datetime import datetime
 from pytz import utc
+from cache import LRUCache
+import csv
+import io
+import json
 
 
 def login_required(f):
@@ -20,6 +25,27 @@ def login_required(f):
     return decorated_function
 
 
+def not_modified(etag, last_modified=None):
+    """
+    Check the request's conditional headers, so unchanged pages can be answered with 304 before rendering them.
+    If-None-Match takes precedence over If-Modified-Since.
+    :param etag: str
+    :param last_modified: datetime or None, to answer If-Modified-Since. Only pass it if the page can't change
+                          without it changing too, otherwise If-Modified-Since is ignored and only the etag is used.
+    :return: bool
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+
+    if request.if_modified_since and last_modified:
+        since = request.if_modified_since
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=utc)
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
 def hash_password(password):
     """
     Encodes password using SHA256 protocol to generate a hash.
@@ -54,55 +80,268 @@ def parse_showtimes(times, duration):
     return showtimes_dt
 
 
-def collides(hall, dt, duration):
+class HallSchedule(object):
     """
+    Showings of a hall sorted by start time, with the running maximum of their end times, so the showings overlapping
+    any period are found in O(log n + k) without going back to the database.
+    """
+
+    def __init__(self, showings):
+        """
+        :param showings: iterable of (datetime start, datetime end, str movie title)
+        """
+        self.showings = sorted(showings, key=lambda showing: showing[0])
+        self.starts = [showing[0] for showing in self.showings]
+
+        self.max_ends = []
+        for start, end, title in self.showings:
+            self.max_ends.append(max(end, self.max_ends[-1]) if self.max_ends else end)
+
+    def add(self, start, end, title):
+        i = bisect_right(self.starts, start)
+        self.showings.insert(i, (start, end, title))
+        self.starts.insert(i, start)
+
+        self.max_ends.insert(i, max(end, self.max_ends[i - 1]) if i else end)
+        for j in range(i + 1, len(self.max_ends)):
+            self.max_ends[j] = max(self.max_ends[j], end)
+
+    def remove(self, start, end, title):
+        """
+        Remove a showing, e.g. when it is cancelled, freeing its slot. Nothing happens if it isn't in the schedule.
+        """
+        i = bisect_left(self.starts, start)
+        while i < len(self.showings) and self.starts[i] == start:
+            if self.showings[i] == (start, end, title):
+                break
+            i += 1
+        else:
+            return
+
+        del self.showings[i]
+        del self.starts[i]
+        del self.max_ends[i]
+
+        # the running maxima after it may have come from its end
+        for j in range(i, len(self.max_ends)):
+            self.max_ends[j] = max(self.showings[j][1], self.max_ends[j - 1]) if j else self.showings[j][1]
 
-    :param hall: neomodel.Node.Hall
-    :param dt: datetime.datetime
+    def overlapping(self, start, end):
+        """
+        :param start: datetime
+        :param end: datetime
+        :return: list of the showings which end after start and start before end, in order of start time
+        """
+        overlaps = []
+
+        # walk back from the last showing starting before end, until no earlier showing ends after start
+        i = bisect_left(self.starts, end) - 1
+        while i >= 0 and self.max_ends[i] > start:
+            if self.showings[i][1] > start:
+                overlaps.append(self.showings[i])
+            i -= 1
+
+        overlaps.reverse()
+        return overlaps
+
+
+def find_collisions(schedule, showtimes, duration):
+    """
+    Check all proposed showtimes against the showings already in a hall.
+    :param schedule: HallSchedule
+    :param showtimes: list of datetime.datetime
     :param duration: datetime.timedelta
-    :return: bool
+    :return: list of (datetime showtime, list of colliding (start, end, title)), empty if nothing collides
     """
+    collisions = []
+    for showtime in showtimes:
+        # a new film collides if it starts before another ends, and ends after the other starts.
+        overlaps = schedule.overlapping(showtime, showtime + duration)
+        if overlaps:
+            collisions.append((showtime, overlaps))
 
-    # check if new film starts before another ends, and whether new film ends after another ends.
-    # If true, this is a collision
-    collisions = hall.shows.filter(end__gt=dt, start__lt=dt + duration)
+    return collisions
 
-    if len(collisions) > 0:
-        return collisions
 
-    return False
+def hall_layout(num_seats, rows=10):
+    """
+    Rows and columns of a hall, as drawn on the hall diagram.
+    :param num_seats: int
+    :param rows: int
+    :return: (int, int)
+    """
+    return rows, num_seats // rows
 
 
-def hall_diagram(hall_number, reserved, row=10, column=12):
+def parse_seats(seats):
+    """
+    Parse the seat numbers entered on the booking form.
+    :param seats: str comma separated seat numbers
+    :return: list of distinct int, in ascending order
     """
+    seat_numbers = set()
+    for seat in seats.split(","):
+        seat_number = int(seat.strip())
+        if seat_number < 1:
+            raise ValueError("Seat numbers must be positive!")
+        seat_numbers.add(seat_number)
+
+    return sorted(seat_numbers)
+
 
-    :param hall_number: int
-    :param reserved: List of reserved seat indeces
+def hall_diagram(showing_uuid, version, reserved, row=10, column=12):
+    """
+    Seat diagram of a showing, cached until the showing's seats change.
+    :param showing_uuid: str
+    :param version: int Showing.version the seat map was read at
+    :param reserved: iterable of reserved seat numbers, e.g. a SeatMap
     :param row: int
     :param column: int
-    :return: str
+    :return: tuple of rows, each a tuple of seat numbers as str or "R" for reserved seats
     """
-    # check for hall diagram in cache
-    diagram = hall_diagram.cache.get(hall_number)
+    # check for diagram of this version of the showing in cache
+    cached = hall_diagram.cache.get(showing_uuid)
+    if cached and cached[0] == version:
+        return cached[1]
 
-    if not diagram:
-        diagram = []
-        for i in range(row):
-            diagram.append([])
-            for j in range(column):
-                diagram[i].append(str((i * column) + j + 1))
+    diagram = []
+    for i in range(row):
+        diagram.append([str((i * column) + j + 1) for j in range(column)])
 
     # mark reserved seats with "R"
     for seat_number in reserved:
-        seat_number -= 1
-        r = seat_number // column
-        c = seat_number % column
-        diagram[r][c] = "R"
+        r, c = divmod(seat_number - 1, column)
+        if r < row:
+            diagram[r][c] = "R"
+
+    diagram = tuple(tuple(seats) for seats in diagram)
 
     # save to cache
-    hall_diagram.cache[hall_number] = diagram
+    hall_diagram.cache.put(showing_uuid, (version, diagram))
 
     return diagram
 
 
-hall_diagram.cache = {}
+def update_hall_diagram(showing_uuid, version, seats, reserved):
+    """
+    Apply a booking or cancellation to the cached diagram of a showing, instead of rebuilding it. Cached diagrams
+    are never modified in place; only the rows containing the seats are copied.
+    :param showing_uuid: str
+    :param version: int Showing.version after the change
+    :param seats: list of int seat numbers booked or released
+    :param reserved: bool True if the seats were booked, False if released
+    """
+    cached = hall_diagram.cache.get(showing_uuid)
+
+    # the cached diagram has to be of the version just before this change, otherwise another change was missed.
+    if not cached or cached[0] != version - 1:
+        hall_diagram.cache.discard(showing_uuid)
+        return
+
+    diagram = list(cached[1])
+    column = len(diagram[0])
+    for seat_number in seats:
+        r, c = divmod(seat_number - 1, column)
+        if r < len(diagram):
+            seats_in_row = list(diagram[r])
+            seats_in_row[c] = "R" if reserved else str(seat_number)
+            diagram[r] = tuple(seats_in_row)
+
+    hall_diagram.cache.put(showing_uuid, (version, tuple(diagram)))
+
+
+# diagrams by showing uuid, as (version, diagram)
+DIAGRAM_CACHE_SIZE = 1024
+
+hall_diagram.cache = LRUCache(maxsize=DIAGRAM_CACHE_SIZE)
+
+
+def history_cursor(time, booking_id):
+    """
+    :param time: float timestamp of the last booking on a page of history
+    :param booking_id: int id of that booking, to break ties between bookings made together
+    :return: str cursor of the next page
+    """
+    return "{time!r}:{id}".format(time=time, id=booking_id)
+
+
+def parse_history_cursor(cursor):
+    """
+    :param cursor: str from history_cursor(), or None
+    :return: (float, int) time and id of the last booking on the previous page, or (None, None)
+    """
+    if not cursor:
+        return None, None
+
+    time, booking_id = cursor.split(":")
+    return float(time), int(booking_id)
+
+
+def history_item(time, title, seat, start, s_uuid, cancelled, cancelled_time, expired):
+    """
+    Format a booking for the history page.
+    :param time: float timestamp the booking was made
+    :param title: str Movie title
+    :param seat: int
+    :param start: float timestamp the showing starts
+    :param s_uuid: str Showing uuid
+    :param cancelled: bool
+    :param cancelled_time: float timestamp, or None
+    :param expired: bool whether the showing has started
+    :return: dict
+    """
+    action_time = datetime.fromtimestamp(time, tz=utc)
+    action_time = action_time.strftime(format="%d/%m/%y @ %H:%M:%S")
+
+    start_time = datetime.fromtimestamp(start)
+    start_time = start_time.strftime(format="%a %d %b %H:%M")
+
+    if cancelled:
+        cancelled_time = datetime.fromtimestamp(cancelled_time, tz=utc)\
+            .strftime(format="%d/%m/%y @ %H:%M:%S")
+    else:
+        cancelled_time = ""
+
+    return {
+        "action_time": action_time,
+        "movie_name": title,
+        "seat": seat,
+        "start_time": start_time,
+        "booking_uuid": s_uuid,
+        "cancelled": cancelled,
+        "cancelled_time": cancelled_time,
+        "expired": expired
+    }
+
+
+def export_csv(showings):
+    """
+    Format exported showings as CSV, a line at a time.
+    :param showings: iterable of (title, start, num_available, num_reserved), see lookup.export_showings()
+    :return: generator of str
+    """
+    line = io.StringIO()
+    writer = csv.writer(line)
+
+    def write(row):
+        writer.writerow(row)
+        value = line.getvalue()
+        line.seek(0)
+        line.truncate()
+        return value
+
+    yield write(["title", "date", "time", "num_reserved", "num_available"])
+    for title, start, num_available, num_reserved in showings:
+        yield write([title, start.strftime(format="%d/%m/%y"), start.strftime(format="%H:%M"),
+                     num_reserved, num_available])
+
+
+def export_ndjson(showings):
+    """
+    Format exported showings as newline delimited JSON.
+    :param showings: iterable of (title, start, num_available, num_reserved), see lookup.export_showings()
+    :return: generator of str
+    """
+    for title, start, num_available, num_reserved in showings:
+        yield json.dumps({"title": title, "start": start.isoformat(), "num_available": num_available,
+                          "num_reserved": num_reserved}) + "\n"
@@ -0,0 +1,88 @@
+from threading import Condition, Thread
+from time import time
+import heapq
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HoldReaper(object):
+    """
+    Releases seat holds when they expire. Holds wait in a heap ordered by expiry, and a single background thread
+    sleeps until the earliest one is due, so expiring a hold costs O(log n) and nothing is ever scanned.
+    """
+
+    def __init__(self, release, sweep=None):
+        """
+        :param release: function (showing uuid, customer uuid, seats, expires) releasing the seats of a hold if it
+                        still expires at or before expires; holds which were confirmed or extended are left alone.
+        :param sweep: function returning expired holds as (showing uuid, customer uuid, seats, expires), called
+                      when the reaper starts to release holds left behind by workers which have since stopped.
+        """
+        self.release = release
+        self.sweep = sweep
+        self.heap = []  # (expires, showing uuid, customer uuid, tuple of seats)
+        self.condition = Condition()
+        self.thread = None
+
+    def __len__(self):
+        return len(self.heap)
+
+    def schedule(self, showing_uuid, customer_uuid, seats, expires):
+        """
+        :param showing_uuid: str
+        :param customer_uuid: str
+        :param seats: iterable of int
+        :param expires: float timestamp
+        """
+        with self.condition:
+            heapq.heappush(self.heap, (expires, showing_uuid, customer_uuid, tuple(seats)))
+
+            # wake the reaper if this hold is now the first due
+            if self.heap[0][0] == expires:
+                self.condition.notify()
+
+            self.start()
+
+    def start(self):
+        """
+        Start the background thread, which first sweeps for expired holds. Called when a worker starts, so holds
+        left behind by stopped workers are released without waiting for a new hold; does nothing once started.
+        """
+        with self.condition:
+            if self.thread is None:
+                self.thread = Thread(target=self.run, name="hold-reaper", daemon=True)
+                self.thread.start()
+
+    def due(self, now):
+        """
+        Pop every hold which has expired.
+        :param now: float timestamp
+        :return: list of (expires, showing uuid, customer uuid, seats)
+        """
+        expired = []
+        with self.condition:
+            while self.heap and self.heap[0][0] <= now:
+                expired.append(heapq.heappop(self.heap))
+
+        return expired
+
+    def run(self):
+        if self.sweep:
+            try:
+                for showing_uuid, customer_uuid, seats, expires in self.sweep():
+                    self.schedule(showing_uuid, customer_uuid, seats, expires)
+            except Exception:
+                logger.exception("Couldn't sweep expired seat holds.")
+
+        while True:
+            with self.condition:
+                while not self.heap or self.heap[0][0] > time():
+                    self.condition.wait(self.heap[0][0] - time() if self.heap else None)
+
+            for expires, showing_uuid, customer_uuid, seats in self.due(time()):
+                try:
+                    self.release(showing_uuid, customer_uuid, list(seats), expires)
+                except Exception:
+                    logger.exception("Couldn't release the hold of seats {seats} of showing {uuid}."
+                                     .format(seats=seats, uuid=showing_uuid))
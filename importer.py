@@ -0,0 +1,165 @@
+from helpers import parse_showtimes, HallSchedule, find_collisions
+from seatmap import SeatMap
+from datetime import timedelta
+from uuid import uuid4
+import csv
+import io
+import json
+
+# columns of a CSV schedule, and keys of each object in a JSON schedule
+FIELDS = ("title", "description", "duration", "hall", "showtimes")
+
+
+def read_schedule(stream, filename):
+    """
+    Read a schedule file. Each entry is a movie showing in one hall at the given times, as on the Add Film form.
+    :param stream: binary file object
+    :param filename: str, its extension decides the format: .csv or .json
+    :return: list of dict with FIELDS as keys
+    """
+    if filename.lower().endswith(".json"):
+        entries = json.loads(stream.read().decode("utf-8-sig"))
+        if not isinstance(entries, list):
+            raise ValueError("A JSON schedule must be a list of films!")
+
+    elif filename.lower().endswith(".csv"):
+        entries = list(csv.DictReader(io.StringIO(stream.read().decode("utf-8-sig"))))
+
+    else:
+        raise ValueError("Schedules must be .csv or .json files!")
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError("Each film in a JSON schedule must be an object!")
+
+        missing = [field for field in FIELDS if not entry.get(field)]
+        if missing:
+            raise ValueError("{title} is missing {fields}!"
+                             .format(title=entry.get("title", "A film"), fields=", ".join(missing)))
+
+    return entries
+
+
+def programme_row(title, description, minutes, hall, num_seats, showtimes):
+    """
+    :param title: str
+    :param description: str
+    :param minutes: int duration
+    :param hall: int Hall name
+    :param num_seats: int number of seats in the hall
+    :param showtimes: list of datetime, as returned by parse_showtimes()
+    :return: dict, one row of the programme for Storage.add_showings()
+    """
+    duration = timedelta(minutes=minutes)
+    return {
+        "uuid": uuid4().hex,
+        "title": title,
+        "description": description,
+        "duration": minutes,
+        "hall": hall,
+        "showtimes": showtimes,
+        "showings": [{"uuid": uuid4().hex,
+                      "start": showtime.timestamp(),
+                      "end": (showtime + duration).timestamp(),
+                      "seat_words": SeatMap(num_seats).words} for showtime in showtimes]
+    }
+
+
+def plan_schedule(entries, storage):
+    """
+    Validate schedule entries the way the Add Film form does, also checking they don't collide with each other.
+    :param entries: list of dict, see read_schedule()
+    :param storage: storage.Storage
+    :return: (list, list) programme for Storage.add_showings(), error messages. Nothing should be written if
+             there are any errors.
+    """
+    halls = storage.hall_capacities()
+    programme = []
+    errors = []
+
+    for line, entry in enumerate(entries, start=1):
+        title = str(entry["title"]).title()
+
+        try:
+            hall = int(entry["hall"])
+            minutes = int(entry["duration"])
+        except (TypeError, ValueError):
+            errors.append("{line}: {title}: hall and duration must be integers!".format(line=line, title=title))
+            continue
+
+        if hall not in halls:
+            errors.append("{line}: {title}: hall {hall} does not exist!".format(line=line, title=title, hall=hall))
+            continue
+
+        # showtimes may be a list in JSON files
+        showtimes = entry["showtimes"]
+        if isinstance(showtimes, list) and all(isinstance(showtime, str) for showtime in showtimes):
+            showtimes = ",".join(showtimes)
+
+        if not isinstance(showtimes, str):
+            errors.append("{line}: {title}: showtimes must be dd/mm/yy HH:MM strings!".format(line=line, title=title))
+            continue
+
+        duration = timedelta(minutes=minutes)
+        try:
+            showtimes = parse_showtimes(showtimes, duration)
+        except ValueError as e:
+            errors.append("{line}: {title}: {e}".format(line=line, title=title, e=e))
+            continue
+
+        programme.append(programme_row(title, entry["description"], minutes, hall, halls[hall], showtimes))
+
+    # check each hall against its existing showings, and against the showings added to it earlier in the file
+    for hall in sorted(set(row["hall"] for row in programme)):
+        rows = [row for row in programme if row["hall"] == hall]
+        start = min(row["showtimes"][0] for row in rows)
+        end = max(row["showtimes"][-1] + timedelta(minutes=row["duration"]) for row in rows)
+        schedule = HallSchedule(storage.hall_schedule(hall, start, end))
+
+        for row in rows:
+            duration = timedelta(minutes=row["duration"])
+            for showtime, clashes in find_collisions(schedule, row["showtimes"], duration):
+                others = ", ".join("{movie} at {time}".format(movie=movie, time=start.strftime(format="%d/%m/%y %H:%M"))
+                                   for start, end, movie in clashes)
+                errors.append("{title} at {showtime} in hall {hall} collides with {others}!"
+                              .format(title=row["title"], showtime=showtime.strftime(format="%d/%m/%y %H:%M"),
+                                      hall=hall, others=others))
+
+            for showtime in row["showtimes"]:
+                schedule.add(showtime, showtime + duration, row["title"])
+
+    return programme, errors
+
+
+def write_schedule(programme, staff_uuid, storage):
+    """
+    Save a validated programme and make it visible to searches.
+    :param programme: list of dict, see plan_schedule()
+    :param staff_uuid: str
+    :param storage: storage.Storage
+    :return: (int, int) number of movies created, number of showings created
+    """
+    movies = storage.add_showings(staff_uuid, programme)
+
+    return len(movies), sum(len(row["showings"]) for row in programme)
+
+
+def import_schedule(stream, filename, staff_uuid, storage):
+    """
+    Read, validate and save a schedule file. Nothing is saved unless the whole file is valid.
+    :param stream: binary file object
+    :param filename: str
+    :param staff_uuid: str
+    :param storage: storage.Storage
+    :return: (tuple, list) (movies created, showings created), error messages
+    """
+    try:
+        entries = read_schedule(stream, filename)
+    except (ValueError, KeyError, csv.Error) as e:
+        return (0, 0), [str(e)]
+
+    programme, errors = plan_schedule(entries, storage)
+    if errors:
+        return (0, 0), errors
+
+    return write_schedule(programme, staff_uuid, storage), []
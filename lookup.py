@@ -1,155 +1,605 @@
-from models import Movie
-from neomodel import db
+from models import Movie, Showing, Hall, MovieListing, LISTING_DESCRIPTION_LENGTH
+from helpers import history_item, history_cursor, parse_history_cursor
+from neomodel import db, config
+from seatmap import SeatMap
+from search import SearchIndex, tokenise
+from cache import LRUCache
+from metrics import record_query
+import queries
+from itertools import count
+from time import time, perf_counter
 from datetime import datetime, timedelta
 from pytz import utc
 
 
-def lookup(query, order_by=None):
-    # if query in lookup.cache:
-    #     return lookup.cache[query]
+def lookup(query, order_by=None, limit=None):
+    """
+    Find movies whose title or description has words starting with the words of the query, best matches first.
+    :param query: str
+    :param order_by: str Movie property to order by instead of relevance
+    :param limit: int maximum number of results
+    :return: list of MovieListing
+    """
+    # check cache first, keyed on the words of the query rather than its spelling
+    key = ("search", " ".join(tokenise(query)), order_by, limit)
+    movies = lookup.cache.get(key)
+    if movies is not None:
+        return movies
 
-    # Cypher command to match query string that starts with given string, ignoring case.
-    cypher_command = """
-                        MATCH (n:Movie)
-                        WHERE (n.title =~ '(?i).*(?<!\\\\S){q}.*') OR 
-                        (n.description =~ '(?i).*(?<!\\\\S){q}.*')
-                        RETURN n 
-                        """.format(q=query)
+    refresh_search_index()
+    movies = search_index.search(query, order_by=order_by, limit=limit)
 
-    # If order specified, order accordingly
-    if order_by and type(order_by) == str:
-        cypher_command += "ORDER BY n.{o) ASC".format(o=order_by)
+    lookup.cache.put(key, movies)
 
-    # Otherwise, order alphabetically
-    else:
-        cypher_command += "ORDER BY n.title ASC"
+    return movies
 
-    movies, meta = db.cypher_query(cypher_command)
 
-    movies = [Movie.inflate(row[0]) for row in movies]  # List of Movie Nodes
-    # lookup.cache[query] = movies
+# results of lookup() and lookup_by_date(). Writes made by this process invalidate it through catalogue_changed();
+# the TTL bounds how long writes made by other workers go unseen.
+LOOKUP_CACHE_SIZE = 512
+LOOKUP_CACHE_TTL = 60
 
-    return movies
+lookup.cache = LRUCache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
 
+search_index = SearchIndex()
 
-lookup.cache = {}
+# how often to check whether other workers have added movies to the catalogue
+SEARCH_INDEX_CHECK_SECONDS = 30
 
 
-def lookup_by_date(query, order_by=None):
-    # check cache first
-    # if query in lookup.cache:
-    #     return lookup.cache[query]
+def refresh_search_index(force=False):
+    """
+    Build the search index on first use, and rebuild it when the number of movies in the database has changed.
+    Movies added by this process are indexed straight away by index_movie().
+    :param force: bool rebuild without checking
+    """
+    now = time()
+    if not force and search_index.checked_at and now - search_index.checked_at < SEARCH_INDEX_CHECK_SECONDS:
+        return
+
+    # served from the label count store, so this doesn't scan the movies.
+    count, meta = db.cypher_query(queries.COUNT_MOVIES)
+
+    if force or count[0][0] != len(search_index):
+        movies, meta = db.cypher_query(queries.ALL_MOVIES)
+        search_index.rebuild(MovieListing(*row) for row in movies)
+
+        # other workers have changed the catalogue
+        catalogue_changed(new_movie=True)
+
+    search_index.checked_at = now
+
+
+def index_movie(movie):
+    """
+    Make a newly created movie searchable.
+    :param movie: Movie
+    """
+    search_index.add(movie)
+
+
+def catalogue_changed(new_movie=False, showtimes=()):
+    """
+    Invalidate the cached lookups affected by adding a movie, or adding or cancelling showings, and move on
+    catalogue_changed.version.
+    :param new_movie: bool whether a movie was created, which can change any search
+    :param showtimes: iterable of datetime start times of the showings created or cancelled
+    """
+    if new_movie:
+        lookup.cache.evict(lambda key: key[0] == "search")
 
+    days = {showtime.astimezone(utc).date() for showtime in showtimes}
+    if days:
+        lookup.cache.evict(lambda key: key[0] == "date" and key[1] in days)
+
+    # after evicting, so nothing rendered for the new version comes from stale lookups
+    catalogue_changed.version = next(catalogue_versions)
+
+
+# changes whenever this process sees the catalogue change, so anything rendered from it can be cached per version.
+catalogue_versions = count(1)
+catalogue_changed.version = 0
+
+
+def catalogue_version():
+    """
+    :return: int catalogue_changed.version, after checking whether other workers have added movies
+    """
+    refresh_search_index()
+    return catalogue_changed.version
+
+
+def lookup_by_date(query, order_by=None, limit=None):
     try:
         dt_start = datetime.strptime(query, "%d/%m/%y").replace(tzinfo=utc)
 
     except ValueError:
-        return lookup(query, order_by)
+        return lookup(query, order_by, limit)
 
-    # get 24 hour period of the day
-    dt_end = dt_start + timedelta(hours=24)
+    if order_by and order_by not in queries.ORDER_FIELDS:
+        raise ValueError("Can't order search results by {o}!".format(o=order_by))
 
-    # convert to floats
-    dt_start = dt_start.timestamp()
-    dt_end = dt_end.timestamp()
+    # check cache first
+    key = ("date", dt_start.date(), order_by, limit)
+    movies = lookup.cache.get(key)
+    if movies is not None:
+        return movies
 
-    # create Cypher command
-    cypher_command = """
-                        MATCH (n:Showing)-[:SHOWING]-(m:Movie) 
-                        WHERE (n.start>={start} AND n.end<{end}) 
-                        RETURN m ORDER BY m.title ASC
-                        """.format(start=dt_start, end=dt_end)
+    # get 24 hour period of the day
+    dt_end = dt_start + timedelta(hours=24)
 
-    movies, meta = db.cypher_query(cypher_command)
+    movies, meta = db.cypher_query(queries.MOVIES_ON_DATE[order_by or "title"],
+                                   {"start": dt_start.timestamp(), "end": dt_end.timestamp(),
+                                    "limit": queries.NO_LIMIT if limit is None else limit,
+                                    "description_length": LISTING_DESCRIPTION_LENGTH + 1})
 
-    movies = [Movie.inflate(row[0]) for row in movies]  # List of Movie Nodes
+    movies = [MovieListing.create(*row) for row in movies]
 
     # update cache
-    # lookup.cache[query] = movies
+    lookup.cache.put(key, movies)
     return movies
 
 
-def user_history(username):
+def hall_schedule(hall_name, start, end):
+    """
+    Every showing in a hall overlapping a period which hasn't been cancelled, with the title of its movie.
+    :param hall_name: int Hall name
+    :param start: datetime
+    :param end: datetime
+    :return: list of (datetime start, datetime end, str title)
+    """
+    showings, meta = db.cypher_query(queries.HALL_SCHEDULE, {"hall": hall_name, "start": start.timestamp(),
+                                                             "end": end.timestamp()})
+
+    return [(datetime.fromtimestamp(s_start, tz=utc), datetime.fromtimestamp(s_end, tz=utc), title)
+            for s_start, s_end, title in showings]
+
+
+def hall_capacities():
     """
-    Run a Cypher command to find all shows Customer has booked/cancelled.
+    :return: dict Hall name -> number of seats
+    """
+    halls, meta = db.cypher_query(queries.HALL_CAPACITIES)
+
+    return {name: num_seats for name, num_seats in halls}
+
+
+def create_showings(staff_uuid, programme, batch_size=500):
+    """
+    Create movies and their showings in batched transactions. Movies which already exist are reused.
+    :param staff_uuid: str uuid of the Staff adding them
+    :param programme: list of dict with "uuid", "title", "description", "duration" (minutes), "hall" and "showings",
+                      a list of dict with "uuid", "start", "end" (timestamps) and "seat_words". See
+                      importer.programme_row().
+    :param batch_size: int number of showings written per transaction. A movie's showings in one hall are always
+                       written together.
+    :return: list of Movie which were created
+    """
+    now = datetime.now(tz=utc).timestamp()
+
+    created = []
+    batch = []
+    batch_showings = 0
+    for i, row in enumerate(programme):
+        batch.append({key: row[key] for key in ("uuid", "title", "description", "duration", "hall", "showings")})
+        batch_showings += len(row["showings"])
+
+        if batch_showings >= batch_size or i == len(programme) - 1:
+            movies, meta = db.cypher_query(queries.CREATE_SHOWINGS, {"staff": staff_uuid, "programme": batch,
+                                                                     "now": now})
+            created.extend(Movie.inflate(movie) for movie, is_new in movies if is_new)
+
+            batch = []
+            batch_showings = 0
+
+    return created
+
+
+def user_history(username, cursor=None, limit=25):
+    """
+    Run a Cypher command to find a page of the shows a Customer has booked/cancelled, newest first. Pages are found
+    by keyset pagination on the booking time, so later pages cost the same as the first.
     :param username: str
-    :return:
+    :param cursor: str from a previous page, or None for the newest bookings
+    :param limit: int page size
+    :return: (list, str) bookings, cursor of the next page or None if this is the last page
+    """
+    time, rel_id = parse_history_cursor(cursor)
+
+    bookings, meta = db.cypher_query(queries.USER_HISTORY, {"username": username, "time": time, "id": rel_id,
+                                                            "now": datetime.now(tz=utc).timestamp(),
+                                                            "limit": limit + 1})
+
+    next_cursor = None
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        next_cursor = history_cursor(bookings[-1][1], bookings[-1][0])
+
+    items = [history_item(*booking[1:]) for booking in bookings]
+
+    return items, next_cursor
+
+
+def booking_details(title, s_uuid):
     """
-    cypher_command = """MATCH (n:Customer)-[r:BOOKED]-(m:Showing)-[s:SHOWING]-(o:Movie) 
-                        WHERE (n.username="{u}") 
-                        RETURN r, m , o
-                        """.format(u=username)
+    Everything the booking page shows about a showing, in one query.
+    :param title: str Movie title
+    :param s_uuid: str Showing uuid
+    :return: (Movie, Showing, Hall), or None if the movie has no such showing.
+    """
+    rows, meta = db.cypher_query(queries.BOOKING_DETAILS, {"title": title, "uuid": s_uuid})
+    if not rows:
+        return None
 
-    cypher_command += "ORDER BY r.time DESC"
+    movie, showing, hall = rows[0]
+    return Movie.inflate(movie), Showing.inflate(showing), Hall.inflate(hall)
 
-    bookings, meta = db.cypher_query(cypher_command)
-    if len(bookings) < 0:
-        raise LookupError("Sorry, no bookings found for {u}.".format(u=username))
 
-    items = []
-    for r in bookings:
-        movie_details = r[2]._properties
-        show_details = r[1]._properties
-        booking_details = r[0]._properties
+def showing_seats(s_uuid):
+    """
+    Current seat map of a Showing.
+    :param s_uuid: str Showing uuid
+    :return: SeatMap, or None if the showing wasn't found.
+    """
+    rows, meta = db.cypher_query(queries.SHOWING_SEATS, {"uuid": s_uuid})
+    if not rows or rows[0][0] is None:
+        return None
 
-        action_time = datetime.fromtimestamp(booking_details["time"], tz=utc)
-        action_time = action_time.strftime(format="%d/%m/%y @ %H:%M:%S")
+    return SeatMap(rows[0][0], rows[0][1])
 
-        start_time = datetime.fromtimestamp(show_details["start"])
-        start_time = start_time.strftime(format="%a %d %b %H:%M")
 
-        cancelled_time = ""
-        if booking_details["cancelled"]:
-            cancelled_time = datetime.fromtimestamp(booking_details["cancelled_time"], tz=utc)\
-                .strftime(format="%d/%m/%y @ %H:%M:%S")
+def movie_showings(title, limit=200):
+    """
+    A movie and its upcoming showings with seats left, grouped by day, in one query.
+    :param title: str
+    :param limit: int maximum number of showings
+    :return: (Movie, list) the movie, and (datetime day, list of showing dicts) in date order. None if the movie
+             wasn't found.
+    """
+    rows, meta = db.cypher_query(queries.MOVIE_SHOWINGS, {"title": title, "now": datetime.now(tz=utc).timestamp(),
+                                                          "limit": limit})
+    if not rows:
+        return None
 
-        expired = False
-        if datetime.fromtimestamp(show_details["start"], tz=utc) < datetime.now(utc):
-            expired = True
+    movie, days = rows[0]
 
-        items.append({
-            "action_time": action_time,
-            "movie_name": movie_details["title"],
-            "seat": booking_details["seat"],
-            "start_time": start_time,
-            "booking_uuid": show_details["uuid"],
-            "cancelled": booking_details["cancelled"],
-            "cancelled_time": cancelled_time,
-            "expired": expired
-        })
+    available = []
+    for day, shows in days:
+        if day is None:
+            continue
 
-    return items
+        for show in shows:
+            show["start"] = datetime.fromtimestamp(show["start"], tz=utc)
+        available.append((datetime.fromtimestamp(day, tz=utc), shows))
 
+    return Movie.inflate(movie), available
 
-def cancel_booking(s_uuid, c_uuid, seat):
+
+def movie_validator(title):
+    """
+    What a movie's showings page depends on, read without fetching its showings.
+    :param title: str
+    :return: (str uuid, int version, datetime modified or None, datetime start of the first showing listed or None),
+             or None if the movie wasn't found.
     """
+    rows, meta = db.cypher_query(queries.MOVIE_VALIDATOR, {"title": title, "now": datetime.now(tz=utc).timestamp()})
+    if not rows:
+        return None
+
+    uuid, version, modified, first_start = rows[0]
+    return (uuid, version or 0, datetime.fromtimestamp(modified, tz=utc) if modified is not None else None,
+            datetime.fromtimestamp(first_start, tz=utc) if first_start is not None else None)
 
+
+def book_seats(title, s_uuid, c_uuid, seats):
+    """
+    Claim seats for a Customer in a single conditional write: either every seat is booked or none are. The Showing
+    node is locked before its seat map is read, so concurrent bookings of the same seat are serialised and only one
+    of them succeeds. Seats the Customer holds are confirmed, and their holds removed.
+    :param title: str Movie title
     :param s_uuid: str Showing uuid
     :param c_uuid: str Customer uuid
-    :param seat: int
-    :return:
+    :param seats: list of distinct int seat numbers
+    :return: dict, whose "taken" lists the seats which are reserved or don't exist. None if the showing wasn't found
+             or has been cancelled.
     """
+    claims = []
+    for seat in seats:
+        word, mask = SeatMap.position(seat)
+        claims.append({"seat": seat, "word": word, "mask": mask})
+
     now = datetime.now(tz=utc).timestamp()
-    command = """
-                MATCH (c:Customer)-[r:BOOKED]-(s:Showing) 
-                WHERE (s.uuid='{uuid}' AND c.uuid='{c}' AND r.seat={seat})
-                SET r.cancelled=true, r.cancelled_time={now}
-                RETURN r
-                """.format(uuid=s_uuid, c=c_uuid, now=now, seat=seat)
 
-    booking, meta = db.cypher_query(command)
+    rows, meta = db.cypher_query(queries.BOOK_SEATS, {"title": title, "uuid": s_uuid, "customer": c_uuid,
+                                                      "claims": claims, "seats": list(seats), "now": now})
+    if not rows or rows[0][8]:
+        return None
+
+    taken, capacity, version, f_name, l_name, duration, hall, start, cancelled = rows[0]
+    return {
+        "booked": not taken,
+        "taken": taken,
+        "capacity": capacity,
+        "version": version,
+        "name": " ".join([f_name, l_name]),
+        "duration": duration,
+        "hall": hall,
+        "start": datetime.fromtimestamp(start, tz=utc)
+    }
+
+
+def book_seats_batch(s_uuid, requests):
+    """
+    Book seats for several Customers of one Showing in a single write, like book_seats() for each of them. Each
+    request is booked in full or not at all. Requests mustn't claim the same seats as each other: they are all
+    checked against the seat map as it was before the batch. Each request booked gets a Showing.version of its own,
+    as if they had been booked one after another.
+    :param s_uuid: str Showing uuid
+    :param requests: list of (str Movie title, str Customer uuid, list of int seat numbers)
+    :return: list of dict, see book_seats(), in the order of requests. None for requests whose showing or customer
+             wasn't found, or whose showing has been cancelled.
+    """
+    params = []
+    for index, (title, c_uuid, seats) in enumerate(requests):
+        claims = []
+        for seat in seats:
+            word, mask = SeatMap.position(seat)
+            claims.append({"seat": seat, "word": word, "mask": mask})
+        params.append({"index": index, "title": title, "customer": c_uuid, "seats": list(seats), "claims": claims})
+
+    now = datetime.now(tz=utc).timestamp()
+
+    rows, meta = db.cypher_query(queries.BOOK_SEATS_BATCH, {"uuid": s_uuid, "requests": params, "now": now})
+
+    bookings = [None] * len(requests)
+    if not rows or rows[0][6]:
+        return bookings
+
+    results, capacity, version, duration, hall, start, cancelled = rows[0]
+
+    # each request booked moved the version on by one, in the order of results
+    booked_version = version - sum(1 for index, taken, f_name, l_name in results if not taken)
+    for index, taken, f_name, l_name in results:
+        if not taken:
+            booked_version += 1
+
+        bookings[index] = {
+            "booked": not taken,
+            "taken": taken,
+            "capacity": capacity,
+            "version": booked_version if not taken else version,
+            "name": " ".join([f_name, l_name]),
+            "duration": duration,
+            "hall": hall,
+            "start": datetime.fromtimestamp(start, tz=utc)
+        }
+
+    return bookings
+
+
+def hold_seats(s_uuid, c_uuid, seats, expires, max_seats=None):
+    """
+    Hold seats for a Customer until they book them or the hold expires, in a single conditional write like
+    book_seats(). Held seats are reserved in the seat map and num_available, so nobody else can claim them. Seats the
+    Customer already holds keep the expiry of their first hold, so nobody can keep seats held by holding them again.
+    :param s_uuid: str Showing uuid
+    :param c_uuid: str Customer uuid
+    :param seats: list of distinct int seat numbers
+    :param expires: float timestamp
+    :param max_seats: int most seats of the showing the Customer may hold at once, or None for no limit
+    :return: dict, whose "taken" lists the seats which are reserved or don't exist, "seats" the seats newly held, and
+             "limited" whether nothing was held as it would have taken the Customer past max_seats. None if the
+             showing wasn't found or has been cancelled.
+    """
+    claims = []
+    for seat in seats:
+        word, mask = SeatMap.position(seat)
+        claims.append({"seat": seat, "word": word, "mask": mask})
+
+    rows, meta = db.cypher_query(queries.HOLD_SEATS, {"uuid": s_uuid, "customer": c_uuid, "claims": claims,
+                                                      "expires": expires, "max_seats": max_seats,
+                                                      "now": datetime.now(tz=utc).timestamp()})
+    if not rows or rows[0][4]:
+        return None
+
+    taken, capacity, version, fresh, cancelled, limited = rows[0]
+    held = not taken and not limited
+    return {"held": held, "taken": taken, "capacity": capacity, "version": version, "seats": fresh if held else [],
+            "limited": limited}
+
+
+def release_holds(s_uuid, c_uuid, seats, before=None):
+    """
+    Free seats held by a Customer.
+    :param s_uuid: str Showing uuid
+    :param c_uuid: str Customer uuid
+    :param seats: list of int seat numbers
+    :param before: float timestamp, to only release holds expiring at or before it, or None
+    :return: (list, int) seats released, Showing.version afterwards. None if the showing wasn't found.
+    """
+    claims = []
+    for seat in seats:
+        word, mask = SeatMap.position(seat)
+        claims.append({"seat": seat, "word": word, "mask": mask})
+
+    rows, meta = db.cypher_query(queries.RELEASE_HOLDS, {"uuid": s_uuid, "customer": c_uuid, "claims": claims,
+                                                         "seats": list(seats), "before": before,
+                                                         "now": datetime.now(tz=utc).timestamp()})
+    if not rows:
+        return None
+
+    released, version = rows[0]
+    return sorted(released), version
+
+
+def expired_holds(now):
+    """
+    :param now: float timestamp
+    :return: list of (str Showing uuid, str Customer uuid, list of int seats, float latest expiry) of holds which
+             have expired.
+    """
+    rows, meta = db.cypher_query(queries.EXPIRED_HOLDS, {"now": now})
+    return [tuple(row) for row in rows]
+
+
+def cancel_booking(s_uuid, c_uuid, seat):
+    """
+    Cancel a booking and free its seat in a single write.
+    :param s_uuid: str Showing uuid
+    :param c_uuid: str Customer uuid
+    :param seat: int
+    :return: int Showing.version after the cancellation, or None if the Customer had no such booking.
+    """
+    word, mask = SeatMap.position(seat)
+    params = {"uuid": s_uuid, "customer": c_uuid, "seat": seat, "word": word, "mask": mask,
+              "now": datetime.now(tz=utc).timestamp()}
+
+    rows, meta = db.cypher_query(queries.CANCEL_BOOKING, params)
+    if rows and rows[0][2]:
+        # the seat is still in the legacy reserved list, which only a seat map can free it from
+        migrate_seat_maps(uuid=s_uuid)
+        rows, meta = db.cypher_query(queries.CANCEL_BOOKING, params)
 
-    return booking
+    if not rows or not rows[0][0]:
+        return None
+
+    return rows[0][1]
+
+
+def cancel_showing(s_uuid):
+    """
+    Cancel a showing and every booking of it, release every seat held for it and free all of its seats, in a single
+    write. The showing is marked cancelled, with no seats available.
+    :param s_uuid: str Showing uuid
+    :return: (dict Customer uuid -> list of int seats cancelled, list of int seats which were held,
+              int Showing.version, datetime start), or None if the showing wasn't found or was already cancelled.
+    """
+    rows, meta = db.cypher_query(queries.CANCEL_SHOWING, {"uuid": s_uuid, "now": datetime.now(tz=utc).timestamp()})
+    if not rows:
+        return None
+
+    bookings, held, version, start = rows[0]
+    return {c_uuid: seats for c_uuid, seats in bookings}, held, version, datetime.fromtimestamp(start, tz=utc)
+
+
+def export_showings():
+    """
+    Stream every showing which hasn't been cancelled with its movie's title, in one query. Records are read from the
+    driver as they are iterated, so memory use doesn't grow with the number of showings.
+    :return: generator of (str title, datetime start, int num_available, int num_reserved)
+    """
+    if not db.driver:
+        db.set_connection(config.DATABASE_URL)
+
+    session = db.driver.session()
+    try:
+        # records stream from an explicit transaction, which also waits for the bookmark given to a read session
+        with session.begin_transaction() as transaction:
+            # run() returns before the records arrive, so the time spent waiting for each of them is added up too,
+            # leaving out the time the caller takes between records.
+            started = perf_counter()
+            records = iter(transaction.run(queries.EXPORT_SHOWINGS))
+            seconds = perf_counter() - started
+
+            try:
+                while True:
+                    started = perf_counter()
+                    try:
+                        title, start, num_available, num_reserved = next(records)
+                    except StopIteration:
+                        break
+                    finally:
+                        seconds += perf_counter() - started
+
+                    yield title, datetime.fromtimestamp(start, tz=utc), num_available, num_reserved
+            finally:
+                record_query(queries.EXPORT_SHOWINGS, seconds)
+    finally:
+        session.close()
+
+
+def migrate_seat_maps(batch_size=500, uuid=None):
+    """
+    Convert the legacy Showing.reserved lists into fixed-width seat maps, deriving num_available from them.
+    Showings holding seat numbers which don't exist in their hall are left untouched and reported, so no
+    reservation is lost.
+    :param batch_size: int number of showings written per transaction
+    :param uuid: str uuid of the only Showing to convert, or None for all of them
+    :return: (int, list) number of showings migrated, uuids of showings which could not be migrated
+    """
+    showings, meta = db.cypher_query(queries.UNMIGRATED_SHOWINGS, {"uuid": uuid})
+
+    rows = []
+    skipped = []
+    for uuid, reserved, num_seats in showings:
+        try:
+            seat_map = SeatMap.from_seats(num_seats, reserved)
+        except ValueError:
+            skipped.append(uuid)
+            continue
+
+        rows.append({"uuid": uuid, "capacity": num_seats, "words": seat_map.words,
+                     "available": seat_map.num_available})
+
+    for i in range(0, len(rows), batch_size):
+        db.cypher_query(queries.MIGRATE_SEAT_MAPS, {"rows": rows[i:i + batch_size]})
+
+    return len(rows), skipped
 
 
 def recommends(movie_title, limit=10):
-    command = """MATCH (m:Movie)-[:SHOWING]->(:Showing)<-[:BOOKED]-(:Customer)
-                        -[popularity:BOOKED]->(:Showing)<-[:SHOWING]-(n:Movie) 
-                 WHERE (m.title="{title}" AND NOT (m.title=n.title)) 
-                 RETURN n, COUNT(popularity) AS p  
-                 ORDER BY p DESC
-                 LIMIT {limit}""".format(title=movie_title, limit=limit)
-
-    movies, meta = db.cypher_query(command)
-    movies = [Movie.inflate(row[0]) for row in movies]  # List of Movie Nodes
+    """
+    Movies most often booked by the Customers who booked this one, read from the CO_BOOKED table.
+    :param movie_title: str
+    :param limit: int
+    :return: list of MovieListing
+    """
+    key = (movie_title, limit)
+    movies = recommends.cache.get(key)
+    if movies is not None:
+        return movies
+
+    movies, meta = db.cypher_query(queries.RECOMMENDS, {"title": movie_title, "limit": limit,
+                                                        "description_length": LISTING_DESCRIPTION_LENGTH + 1})
+    movies = [MovieListing.create(*row) for row in movies]
+
+    recommends.cache.put(key, movies)
     return movies
+
+
+# top recommendations per movie. Bookings made by this process invalidate the movies they affect.
+RECOMMENDS_CACHE_SIZE = 512
+RECOMMENDS_CACHE_TTL = 300
+
+recommends.cache = LRUCache(maxsize=RECOMMENDS_CACHE_SIZE, ttl=RECOMMENDS_CACHE_TTL)
+
+
+def record_co_bookings(s_uuid, deltas):
+    """
+    Keep the CO_BOOKED table up to date after Customers book or cancel seats. For each pair of movies it counts,
+    over every Customer, the Customer's bookings of one times their bookings of the other; the same popularity
+    recommends() used to compute by traversing the whole booking history.
+    :param s_uuid: str uuid of the Showing booked or cancelled
+    :param deltas: dict Customer uuid -> int number of seats they booked, negative for cancellations
+    """
+    changes = [{"customer": c_uuid, "delta": delta} for c_uuid, delta in deltas.items() if delta]
+    if not changes:
+        return
+
+    pairs, meta = db.cypher_query(queries.RECORD_CO_BOOKINGS, {"showing": s_uuid, "changes": changes})
+
+    titles = set()
+    for pair in pairs:
+        titles.update(pair)
+    recommends.cache.evict(lambda key: key[0] in titles)
+
+
+def rebuild_co_bookings():
+    """
+    Recompute the whole CO_BOOKED table from the booking history.
+    :return: int number of movie pairs with bookings in common
+    """
+    pairs, meta = db.cypher_query(queries.REBUILD_CO_BOOKINGS)
+    recommends.cache.clear()
+
+    return pairs[0][0]
@@ -0,0 +1,190 @@
+from flask import g, has_request_context
+from neomodel import db
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+# upper bounds, in seconds, of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# number of a slow request's queries logged, slowest first, and how much of each query's text
+SLOW_QUERIES_LOGGED = 5
+QUERY_TEXT_LOGGED = 300
+
+
+class Histogram(object):
+    """
+    Prometheus style histogram: counts of observations no greater than each bucket's upper bound.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)  # not cumulative, the last bucket holds values above every bound
+        self.over = 0
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.over += 1
+
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        :return: list of (str le label, int count), ending with +Inf
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((repr(float(bound)), total))
+
+        result.append(("+Inf", total + self.over))
+        return result
+
+
+class Metrics(object):
+    """
+    Request latency, database queries per route and cache statistics, rendered in the Prometheus text format.
+    Routes are labelled by endpoint name, so there is one series per view function rather than per URL.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.latency = {}  # route -> Histogram
+        self.responses = {}  # (route, status) -> int
+        self.queries = {}  # route -> [int number of queries, float seconds]
+        self.caches = {}  # name -> cache.LRUCache
+
+    def register_cache(self, name, cache):
+        self.caches[name] = cache
+
+    def observe_request(self, route, status, seconds, queries):
+        """
+        :param route: str endpoint
+        :param status: int response status code
+        :param seconds: float time taken
+        :param queries: list of (str query, float seconds) run while handling the request
+        """
+        with self.lock:
+            self.latency.setdefault(route, Histogram()).observe(seconds)
+            self.responses[(route, status)] = self.responses.get((route, status), 0) + 1
+
+            totals = self.queries.setdefault(route, [0, 0.0])
+            totals[0] += len(queries)
+            totals[1] += sum(elapsed for query, elapsed in queries)
+
+    def render(self):
+        """
+        :return: str metrics in the Prometheus text exposition format
+        """
+        lines = []
+
+        with self.lock:
+            lines.append("# HELP theatre_request_duration_seconds Time taken to handle a request.")
+            lines.append("# TYPE theatre_request_duration_seconds histogram")
+            for route, histogram in sorted(self.latency.items()):
+                for le, count in histogram.cumulative():
+                    lines.append('theatre_request_duration_seconds_bucket{{route="{route}",le="{le}"}} {n}'
+                                 .format(route=route, le=le, n=count))
+                lines.append('theatre_request_duration_seconds_sum{{route="{route}"}} {s}'
+                             .format(route=route, s=histogram.sum))
+                lines.append('theatre_request_duration_seconds_count{{route="{route}"}} {n}'
+                             .format(route=route, n=histogram.count))
+
+            lines.append("# HELP theatre_responses_total Responses sent, by status code.")
+            lines.append("# TYPE theatre_responses_total counter")
+            for (route, status), count in sorted(self.responses.items()):
+                lines.append('theatre_responses_total{{route="{route}",status="{status}"}} {n}'
+                             .format(route=route, status=status, n=count))
+
+            lines.append("# HELP theatre_db_queries_total Database queries run while handling requests.")
+            lines.append("# TYPE theatre_db_queries_total counter")
+            for route, (count, seconds) in sorted(self.queries.items()):
+                lines.append('theatre_db_queries_total{{route="{route}"}} {n}'.format(route=route, n=count))
+
+            lines.append("# HELP theatre_db_query_seconds_total Time spent in database queries.")
+            lines.append("# TYPE theatre_db_query_seconds_total counter")
+            for route, (count, seconds) in sorted(self.queries.items()):
+                lines.append('theatre_db_query_seconds_total{{route="{route}"}} {s}'.format(route=route, s=seconds))
+
+        for metric, kind, description in (("hits", "counter", "Cache lookups which found an entry."),
+                                          ("misses", "counter", "Cache lookups which found nothing."),
+                                          ("size", "gauge", "Entries in the cache.")):
+            name = "theatre_cache_{metric}{suffix}".format(metric=metric, suffix="_total" if kind == "counter" else "")
+            lines.append("# HELP {name} {description}".format(name=name, description=description))
+            lines.append("# TYPE {name} {kind}".format(name=name, kind=kind))
+            for cache_name, cache in sorted(self.caches.items()):
+                lines.append('{name}{{cache="{cache}"}} {n}'.format(name=name, cache=cache_name,
+                                                                    n=cache.stats[metric]))
+
+        return "\n".join(lines) + "\n"
+
+
+def record_query(query, seconds):
+    """
+    Remember a query run while handling the current request. Queries run outside a request, e.g. by CLI commands,
+    aren't recorded.
+    :param query: str Cypher
+    :param seconds: float
+    """
+    if has_request_context() and "queries" in g:
+        g.queries.append((query, seconds))
+
+
+@contextmanager
+def timed_query(query):
+    """
+    Record the time spent in a block which runs a query without going through neomodel's db.cypher_query().
+    :param query: str Cypher
+    """
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        record_query(query, perf_counter() - started)
+
+
+def instrument_queries():
+    """
+    Time every query neomodel runs. db is a threading.local, so the method is wrapped on its class rather than on
+    db itself, where it would only be replaced for the current thread.
+    """
+    database = type(db)
+    if getattr(database.cypher_query, "instrumented", False):
+        return
+
+    cypher_query = database.cypher_query
+
+    @wraps(cypher_query)
+    def timed_cypher_query(self, query, *args, **kwargs):
+        with timed_query(query):
+            return cypher_query(self, query, *args, **kwargs)
+
+    timed_cypher_query.instrumented = True
+    database.cypher_query = timed_cypher_query
+
+
+def slow_request_report(route, seconds, queries):
+    """
+    :param route: str endpoint
+    :param seconds: float time taken
+    :param queries: list of (str query, float seconds)
+    :return: str log message naming the slowest queries
+    """
+    lines = ["Slow request to {route}: {ms:.0f}ms, {n} queries taking {q:.0f}ms"
+             .format(route=route, ms=seconds * 1000, n=len(queries),
+                     q=sum(elapsed for query, elapsed in queries) * 1000)]
+
+    for query, elapsed in sorted(queries, key=lambda item: -item[1])[:SLOW_QUERIES_LOGGED]:
+        lines.append("  {ms:.0f}ms: {query}".format(ms=elapsed * 1000,
+                                                   query=" ".join(query.split())[:QUERY_TEXT_LOGGED]))
+
+    return "\n".join(lines)
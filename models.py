@@ -1,8 +1,14 @@
 from neomodel import StructuredNode, StringProperty, UniqueIdProperty, DateTimeProperty, IntegerProperty, BooleanProperty,\
     ArrayProperty, StructuredRel, RelationshipTo, RelationshipFrom
+from collections import namedtuple
 from datetime import datetime
+from seatmap import SeatMap
+from textwrap import shorten
 import pytz
 
+# characters of a movie's description shown where movies are listed
+LISTING_DESCRIPTION_LENGTH = 200
+
 
 class Added(StructuredRel):
     time = DateTimeProperty(default=lambda: datetime.now(pytz.utc))
@@ -15,6 +21,11 @@ class Booked(StructuredRel):
     seat = IntegerProperty(required=True)
 
 
+class Held(StructuredRel):
+    seat = IntegerProperty(required=True)
+    expires = DateTimeProperty(required=True)  # released by the hold reaper after this, unless booked
+
+
 class Staff(StructuredNode):
     uuid = UniqueIdProperty()
     username = StringProperty(unique_index=True)
@@ -44,6 +55,7 @@ class Customer(StructuredNode):
     email = StringProperty(default="")
 
     booked = RelationshipTo("Showing", "BOOKED", model=Booked)
+    holds = RelationshipTo("Showing", "HOLDS", model=Held)
 
     @property
     def serialize(self):
@@ -59,26 +71,73 @@ class Customer(StructuredNode):
 
 class Movie(StructuredNode):
     uuid = UniqueIdProperty()
-    title = StringProperty(required=True)
+    title = StringProperty(unique_index=True, required=True)
     description = StringProperty(required=True)
     duration = IntegerProperty(required=True)
+    version = IntegerProperty(default=0)  # incremented whenever its showings change
+    modified = DateTimeProperty()
 
     showing = RelationshipTo("Showing", "SHOWING")
 
 
+class MovieListing(namedtuple("MovieListing", ("uuid", "title", "duration", "description"))):
+    """
+    What search results and recommendations show of a Movie, with its description shortened. Much smaller than an
+    inflated Movie, and immutable, so cached lists of them can be shared between threads.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, uuid, title, duration, description):
+        """
+        :param description: str, shortened to LISTING_DESCRIPTION_LENGTH characters at a word boundary
+        """
+        return cls(uuid, title, duration, shorten(description or "", LISTING_DESCRIPTION_LENGTH, placeholder="..."))
+
+    @classmethod
+    def of(cls, movie):
+        """
+        :param movie: Movie, or anything else with its fields
+        """
+        return cls.create(movie.uuid, movie.title, movie.duration, movie.description)
+
+
 class Showing(StructuredNode):
     uuid = UniqueIdProperty()
-    start = DateTimeProperty(required=True)
-    end = DateTimeProperty(required=True)
-    reserved = ArrayProperty(default=[])
+    start = DateTimeProperty(required=True, index=True)
+    end = DateTimeProperty(required=True, index=True)
+    reserved = ArrayProperty(default=[])  # legacy list of seat numbers, superseded by seat_words
+    seat_words = ArrayProperty(IntegerProperty(), default=[])
+    capacity = IntegerProperty()
     num_available = IntegerProperty(required=True)
+    version = IntegerProperty(default=0)  # incremented whenever seats are booked or released
+    cancelled = BooleanProperty(default=False)  # cancelled showings can't be booked or held and aren't listed
 
     location = RelationshipTo("Hall", "IN")
     movie = RelationshipFrom("Movie", "SHOWING")
 
+    @property
+    def seats(self):
+        """
+        Bitset of reserved seats. Showings which have not been migrated yet are read from the legacy list.
+        :return: SeatMap
+        """
+        if self.capacity is None:
+            return SeatMap.from_seats(self.num_available + len(set(self.reserved)), self.reserved)
+
+        return SeatMap(self.capacity, self.seat_words)
+
+    @seats.setter
+    def seats(self, seat_map):
+        self.capacity = seat_map.capacity
+        self.seat_words = seat_map.words
+        self.reserved = []
+        self.num_available = seat_map.num_available
+
     @property
     def serialize(self):
-        return {"start": self.start, "end": self.end, "reserved": self.reserved, "num_available": self.num_available}
+        return {"start": self.start, "end": self.end, "reserved": list(self.seats),
+                "num_available": self.num_available}
 
 
 class Hall(StructuredNode):
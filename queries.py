@@ -0,0 +1,362 @@
+"""
+Every Cypher query the app runs. Neo4j caches a query's plan by its text, so values are always passed as
+parameters and never formatted into the text, and each query is planned once instead of once per value.
+"""
+
+# attributes the movies showing on a date can be ordered by; the text of a query can't be a parameter.
+ORDER_FIELDS = ("title", "duration")
+
+# the most rows LIMIT $limit can return, for lookups which aren't limited
+NO_LIMIT = 2 ** 31 - 1
+
+# cheapest round trip, to open connections before they are needed
+PING = """
+    RETURN 1
+    """
+
+# number of movies, to tell whether the search index is up to date
+COUNT_MOVIES = """
+    MATCH (m:Movie)
+    RETURN count(m)
+    """
+
+# every movie, to rebuild the search index
+ALL_MOVIES = """
+    MATCH (m:Movie)
+    RETURN m.uuid, m.title, m.duration, m.description
+    """
+
+# listings of the movies with a showing starting and ending between $start and $end which hasn't been cancelled,
+# ordered by one of ORDER_FIELDS.
+# only the start of the description, which listings shorten, is sent.
+MOVIES_ON_DATE = {field: """
+    MATCH (s:Showing)<-[:SHOWING]-(m:Movie)
+    WHERE s.start >= $start AND s.end < $end AND NOT coalesce(s.cancelled, false)
+    WITH DISTINCT m
+    RETURN m.uuid, m.title, m.duration, left(m.description, $description_length)
+    ORDER BY m.{field} ASC, m.title ASC
+    LIMIT $limit
+    """.format(field=field) for field in ORDER_FIELDS}
+
+# capacity of every hall
+HALL_CAPACITIES = """
+    MATCH (h:Hall)
+    RETURN h.name, h.num_seats
+    """
+
+# every showing in a hall overlapping a period which hasn't been cancelled, with its movie's title
+HALL_SCHEDULE = """
+    MATCH (:Hall {name: $hall})<-[:IN]-(s:Showing)<-[:SHOWING]-(m:Movie)
+    WHERE s.end > $start AND s.start < $end AND NOT coalesce(s.cancelled, false)
+    RETURN s.start, s.end, m.title
+    """
+
+# a batch of movies, reusing those which exist, and their showings
+CREATE_SHOWINGS = """
+    MATCH (st:Staff {uuid: $staff})
+    UNWIND $programme AS row
+    MATCH (h:Hall {name: row.hall})
+    MERGE (m:Movie {title: row.title})
+      ON CREATE SET m.uuid=row.uuid, m.description=row.description, m.duration=row.duration
+    MERGE (st)-[a:ADDED]->(m)
+      ON CREATE SET a.time=$now
+    SET m.version=coalesce(m.version, 0) + 1, m.modified=$now
+    WITH m, h, row, m.uuid = row.uuid AS created
+    UNWIND row.showings AS show
+    CREATE (m)-[:SHOWING]->(:Showing {uuid: show.uuid, start: show.start, end: show.end,
+                                      capacity: h.num_seats, num_available: h.num_seats,
+                                      seat_words: show.seat_words})-[:IN]->(h)
+    RETURN DISTINCT m, created
+    """
+
+# a page of a Customer's bookings, newest first, after the cursor $time, $id
+# bookings made together share a time, so the relationship id breaks ties.
+USER_HISTORY = """
+    MATCH (:Customer {username: $username})-[r:BOOKED]->(s:Showing)<-[:SHOWING]-(m:Movie)
+    WHERE $time IS NULL OR r.time < $time OR (r.time = $time AND id(r) < $id)
+    RETURN id(r), r.time, m.title, r.seat, s.start, s.uuid, r.cancelled, r.cancelled_time,
+           s.start < $now AS expired
+    ORDER BY r.time DESC, id(r) DESC
+    LIMIT $limit
+    """
+
+# a showing with its movie and hall, for the booking page
+BOOKING_DETAILS = """
+    MATCH (m:Movie {title: $title})-[:SHOWING]->(s:Showing {uuid: $uuid})-[:IN]->(h:Hall)
+    RETURN m, s, h
+    """
+
+# seat map of a showing
+SHOWING_SEATS = """
+    MATCH (s:Showing {uuid: $uuid})
+    RETURN s.capacity, s.seat_words
+    """
+
+# a movie and its upcoming showings with seats left, grouped by day, leaving out cancelled showings
+MOVIE_SHOWINGS = """
+    MATCH (m:Movie {title: $title})
+    OPTIONAL MATCH (m)-[:SHOWING]->(s:Showing)
+    WHERE s.start > $now AND s.num_available > 0 AND NOT coalesce(s.cancelled, false)
+    WITH m, s ORDER BY s.start ASC LIMIT $limit
+    WITH m, s.start - s.start % 86400 AS day, collect(s {.uuid, .start, .num_available}) AS shows
+    ORDER BY day ASC
+    RETURN m, collect([day, shows]) AS days
+    """
+
+# what the movie's showings page depends on, to answer conditional requests without building the page
+MOVIE_VALIDATOR = """
+    MATCH (m:Movie {title: $title})
+    OPTIONAL MATCH (m)-[:SHOWING]->(s:Showing)
+    WHERE s.start > $now AND s.num_available > 0 AND NOT coalesce(s.cancelled, false)
+    RETURN m.uuid, m.version, m.modified, min(s.start)
+    """
+
+# claim every seat for a Customer, or none of them, confirming their holds. cancelled showings aren't found.
+# the throwaway _lock write takes the Showing's write lock before anything is read. cancelled is read again once it is
+# held, as the showing may have been cancelled while waiting for it; every seat is then taken, and the last column set.
+BOOK_SEATS = """
+    MATCH (m:Movie {title: $title})-[:SHOWING]->(s:Showing {uuid: $uuid})-[:IN]->(h:Hall)
+    WHERE NOT coalesce(s.cancelled, false)
+    MATCH (c:Customer {uuid: $customer})
+    SET s._lock=true
+    WITH m, s, h, c
+    OPTIONAL MATCH (c)-[held:HOLDS]->(s)
+    WHERE held.seat IN $seats
+    WITH m, s, h, c, collect(held) AS holds
+    WITH m, s, h, c, holds, [claim IN $claims WHERE NOT claim.seat IN [held IN holds | held.seat]] AS fresh
+    WITH m, s, h, c, holds, fresh,
+         [claim IN fresh WHERE coalesce(s.cancelled, false) OR
+                               NOT coalesce(claim.seat >= 1 AND claim.seat <= s.capacity AND
+                                            (s.seat_words[claim.word] / claim.mask) % 2 = 0, false)
+          | claim.seat] AS taken
+    FOREACH (_ IN CASE WHEN size(taken) = 0 THEN [1] ELSE [] END |
+        SET s.seat_words=reduce(words = s.seat_words, claim IN fresh |
+                words[..claim.word] + [words[claim.word] + claim.mask] + words[claim.word + 1..]),
+            s.num_available=s.num_available - size(fresh),
+            s.version=coalesce(s.version, 0) + 1,
+            m.version=coalesce(m.version, 0) + 1,
+            m.modified=$now
+        FOREACH (held IN holds | DELETE held)
+        FOREACH (claim IN $claims |
+            CREATE (c)-[:BOOKED {seat: claim.seat, time: $now, cancelled: false}]->(s))
+    )
+    REMOVE s._lock
+    RETURN taken, s.capacity, s.version, c.f_name, c.l_name, m.duration, h.name, s.start, coalesce(s.cancelled, false)
+    """
+
+# BOOK_SEATS for several Customers of one showing, whose claims don't overlap
+# customers are matched before the lock is taken, so a batch with none left never leaves _lock behind.
+# like BOOK_SEATS, nothing is booked if the showing was cancelled while waiting for the lock.
+# the version goes up once per request booked, so each can be applied to cached diagrams as a change of its own.
+BOOK_SEATS_BATCH = """
+    MATCH (m:Movie)-[:SHOWING]->(s:Showing {uuid: $uuid})-[:IN]->(h:Hall)
+    WHERE NOT coalesce(s.cancelled, false)
+    UNWIND $requests AS request
+    MATCH (c:Customer {uuid: request.customer})
+    WHERE request.title = m.title
+    WITH m, s, h, collect({request: request, customer: c}) AS admitted
+    SET s._lock=true
+    WITH m, s, h, admitted
+    UNWIND admitted AS a
+    WITH m, s, h, a.request AS request, a.customer AS c
+    OPTIONAL MATCH (c)-[held:HOLDS]->(s)
+    WHERE held.seat IN request.seats
+    WITH m, s, h, request, c, collect(held) AS holds
+    WITH m, s, h, request, c, holds,
+         [claim IN request.claims WHERE NOT claim.seat IN [held IN holds | held.seat]] AS fresh
+    WITH m, s, h, request, c, holds, fresh,
+         [claim IN fresh WHERE coalesce(s.cancelled, false) OR
+                               NOT coalesce(claim.seat >= 1 AND claim.seat <= s.capacity AND
+                                            (s.seat_words[claim.word] / claim.mask) % 2 = 0, false)
+          | claim.seat] AS taken
+    WITH m, s, h, collect({index: request.index, claims: request.claims, customer: c, holds: holds,
+                           fresh: fresh, taken: taken}) AS results
+    WITH m, s, h, results, [r IN results WHERE size(r.taken) = 0] AS booked
+    FOREACH (_ IN CASE WHEN size(booked) > 0 THEN [1] ELSE [] END |
+        SET s.seat_words=reduce(words = s.seat_words,
+                                claim IN reduce(claims = [], r IN booked | claims + r.fresh) |
+                words[..claim.word] + [words[claim.word] + claim.mask] + words[claim.word + 1..]),
+            s.num_available=s.num_available - reduce(n = 0, r IN booked | n + size(r.fresh)),
+            s.version=coalesce(s.version, 0) + size(booked),
+            m.version=coalesce(m.version, 0) + 1,
+            m.modified=$now
+        FOREACH (r IN booked |
+            FOREACH (held IN r.holds | DELETE held)
+            FOREACH (c IN [r.customer] |
+                FOREACH (claim IN r.claims |
+                    CREATE (c)-[:BOOKED {seat: claim.seat, time: $now, cancelled: false}]->(s))))
+    )
+    REMOVE s._lock
+    RETURN [r IN results | [r.index, r.taken, r.customer.f_name, r.customer.l_name]],
+           s.capacity, s.version, m.duration, h.name, s.start, coalesce(s.cancelled, false)
+    """
+
+# hold every seat for a Customer, or none of them. cancelled showings aren't found, even when cancelled while waiting
+# for the lock, like BOOK_SEATS. holds they already have keep their expiry, so re-holding a seat can't keep it forever,
+# and nothing is held if the Customer would then hold more than $max_seats seats of the showing, unless it is null.
+HOLD_SEATS = """
+    MATCH (m:Movie)-[:SHOWING]->(s:Showing {uuid: $uuid})
+    WHERE NOT coalesce(s.cancelled, false)
+    MATCH (c:Customer {uuid: $customer})
+    SET s._lock=true
+    WITH m, s, c
+    OPTIONAL MATCH (c)-[held:HOLDS]->(s)
+    WITH m, s, c, collect(held.seat) AS holding
+    WITH m, s, c, holding, [claim IN $claims WHERE NOT claim.seat IN holding] AS fresh
+    WITH m, s, c, fresh, $max_seats IS NOT NULL AND size(holding) + size(fresh) > $max_seats AS over,
+         [claim IN fresh WHERE coalesce(s.cancelled, false) OR
+                               NOT coalesce(claim.seat >= 1 AND claim.seat <= s.capacity AND
+                                            (s.seat_words[claim.word] / claim.mask) % 2 = 0, false)
+          | claim.seat] AS taken
+    FOREACH (_ IN CASE WHEN size(taken) = 0 AND NOT over AND size(fresh) > 0 THEN [1] ELSE [] END |
+        SET s.seat_words=reduce(words = s.seat_words, claim IN fresh |
+                words[..claim.word] + [words[claim.word] + claim.mask] + words[claim.word + 1..]),
+            s.num_available=s.num_available - size(fresh),
+            s.version=coalesce(s.version, 0) + 1,
+            m.version=coalesce(m.version, 0) + 1,
+            m.modified=$now
+        FOREACH (claim IN fresh |
+            CREATE (c)-[:HOLDS {seat: claim.seat, expires: $expires}]->(s))
+    )
+    REMOVE s._lock
+    RETURN taken, s.capacity, s.version, [claim IN fresh | claim.seat], coalesce(s.cancelled, false), over
+    """
+
+# free seats held by a Customer, only those expiring by $before unless it is null
+RELEASE_HOLDS = """
+    MATCH (m:Movie)-[:SHOWING]->(s:Showing {uuid: $uuid})
+    SET s._lock=true
+    WITH m, s
+    OPTIONAL MATCH (:Customer {uuid: $customer})-[held:HOLDS]->(s)
+    WHERE held.seat IN $seats AND ($before IS NULL OR held.expires <= $before)
+    WITH m, s, collect(held) AS holds
+    WITH m, s, holds, [held IN holds | held.seat] AS released
+    FOREACH (held IN holds | DELETE held)
+    FOREACH (_ IN CASE WHEN size(released) > 0 THEN [1] ELSE [] END |
+        SET s.seat_words=reduce(words = s.seat_words, claim IN [c IN $claims WHERE c.seat IN released] |
+                words[..claim.word] +
+                [words[claim.word] - CASE WHEN (words[claim.word] / claim.mask) % 2 = 1
+                                          THEN claim.mask ELSE 0 END] +
+                words[claim.word + 1..]),
+            s.num_available=s.num_available + size(released),
+            s.version=coalesce(s.version, 0) + 1,
+            m.version=coalesce(m.version, 0) + 1,
+            m.modified=$now
+    )
+    REMOVE s._lock
+    RETURN released, s.version
+    """
+
+# holds which have expired, per showing and Customer
+EXPIRED_HOLDS = """
+    MATCH (c:Customer)-[held:HOLDS]->(s:Showing)
+    WHERE held.expires <= $now
+    RETURN s.uuid, c.uuid, collect(held.seat), max(held.expires)
+    """
+
+# cancel one of a Customer's bookings and free its seat, if it isn't cancelled already
+# the booking is checked again once the Showing's write lock is held, so two cancellations can't both free the seat.
+# showings without a seat map are left untouched, to be migrated first; the last column tells which they are.
+CANCEL_BOOKING = """
+    MATCH (c:Customer {uuid: $customer})-[r:BOOKED {seat: $seat, cancelled: false}]->(s:Showing {uuid: $uuid}),
+          (s)<-[:SHOWING]-(m:Movie)
+    SET s._lock=true
+    WITH r, s, m, r.cancelled = false AND s.capacity IS NOT NULL AS live
+    WITH r, s, m, live, live AND (s.seat_words[$word] / $mask) % 2 = 1 AS reserved
+    FOREACH (_ IN CASE WHEN live THEN [1] ELSE [] END |
+        SET r.cancelled=true, r.cancelled_time=$now,
+            s.version=coalesce(s.version, 0) + 1,
+            m.version=coalesce(m.version, 0) + 1,
+            m.modified=$now
+    )
+    FOREACH (_ IN CASE WHEN reserved THEN [1] ELSE [] END |
+        SET s.seat_words=s.seat_words[..$word] + [s.seat_words[$word] - $mask] + s.seat_words[$word + 1..],
+            s.num_available=s.num_available + 1
+    )
+    REMOVE s._lock
+    RETURN live, s.version, s.capacity IS NULL
+    """
+
+# cancel a showing and every booking of it, release its holds and free all of its seats.
+# it is marked cancelled with no seats available, so nothing can be booked or held for it again.
+CANCEL_SHOWING = """
+    MATCH (m:Movie)-[:SHOWING]->(s:Showing {uuid: $uuid})
+    WHERE NOT coalesce(s.cancelled, false)
+    SET s._lock=true
+    WITH m, s
+    OPTIONAL MATCH (:Customer)-[held:HOLDS]->(s)
+    WITH m, s, collect(held) AS holds, collect(held.seat) AS held
+    FOREACH (h IN holds | DELETE h)
+    WITH m, s, held
+    OPTIONAL MATCH (c:Customer)-[r:BOOKED {cancelled: false}]->(s)
+    SET r.cancelled=true, r.cancelled_time=$now
+    WITH m, s, held, c, collect(r.seat) AS seats
+    WITH m, s, held, [booking IN collect([c.uuid, seats]) WHERE booking[0] IS NOT NULL] AS bookings
+    SET s.seat_words=[word IN s.seat_words | 0],
+        s.num_available=0,
+        s.cancelled=true,
+        s.version=coalesce(s.version, 0) + 1,
+        m.version=coalesce(m.version, 0) + 1,
+        m.modified=$now
+    REMOVE s._lock
+    RETURN bookings, held, s.version, s.start
+    """
+
+# every showing which hasn't been cancelled with its movie's title
+EXPORT_SHOWINGS = """
+    MATCH (m:Movie)-[:SHOWING]->(s:Showing)
+    WHERE NOT coalesce(s.cancelled, false)
+    RETURN m.title, s.start, s.num_available, coalesce(s.capacity - s.num_available, size(s.reserved))
+    ORDER BY m.title ASC, s.start ASC
+    """
+
+# showings still holding the legacy reserved list instead of a seat map, only the one with $uuid unless it is null
+UNMIGRATED_SHOWINGS = """
+    MATCH (s:Showing)-[:IN]->(h:Hall)
+    WHERE s.capacity IS NULL AND ($uuid IS NULL OR s.uuid = $uuid)
+    RETURN s.uuid, coalesce(s.reserved, []), h.num_seats
+    """
+
+# write a batch of seat maps, skipping showings which have been migrated since they were read
+MIGRATE_SEAT_MAPS = """
+    UNWIND $rows AS row
+    MATCH (s:Showing {uuid: row.uuid})
+    WHERE s.capacity IS NULL
+    SET s.capacity=row.capacity, s.seat_words=row.words, s.num_available=row.available
+    REMOVE s.reserved
+    """
+
+# listings of the movies most often booked by the Customers who booked this one
+RECOMMENDS = """
+    MATCH (m:Movie {title: $title})-[r:CO_BOOKED]->(n:Movie)
+    WHERE r.count > 0
+    RETURN n.uuid, n.title, n.duration, left(n.description, $description_length)
+    ORDER BY r.count DESC, n.title ASC
+    LIMIT $limit
+    """
+
+# adjust the CO_BOOKED counts between a showing's movie and other movies booked by each Customer in $changes
+RECORD_CO_BOOKINGS = """
+    MATCH (m:Movie)-[:SHOWING]->(:Showing {uuid: $showing})
+    UNWIND $changes AS change
+    MATCH (:Customer {uuid: change.customer})-[b:BOOKED]->(:Showing)<-[:SHOWING]-(x:Movie)
+    WHERE b.cancelled = false AND x <> m
+    WITH m, x, change.delta AS delta, count(b) AS weight
+    MERGE (m)-[r:CO_BOOKED]->(x)
+    MERGE (x)-[t:CO_BOOKED]->(m)
+    SET r.count=coalesce(r.count, 0) + delta * weight,
+        t.count=coalesce(t.count, 0) + delta * weight
+    RETURN DISTINCT m.title, x.title
+    """
+
+# recompute every CO_BOOKED count from the booking history
+REBUILD_CO_BOOKINGS = """
+    OPTIONAL MATCH ()-[old:CO_BOOKED]->()
+    DELETE old
+    WITH count(old) AS deleted
+    MATCH (m:Movie)-[:SHOWING]->(:Showing)<-[a:BOOKED]-(:Customer)-[b:BOOKED]->(:Showing)<-[:SHOWING]-(n:Movie)
+    WHERE a.cancelled = false AND b.cancelled = false AND m <> n
+    WITH m, n, count(*) AS popularity
+    CREATE (m)-[:CO_BOOKED {count: popularity}]->(n)
+    RETURN count(*)
+    """
@@ -0,0 +1,123 @@
+from models import Staff, Customer, Movie, Showing, Hall, LISTING_DESCRIPTION_LENGTH
+from neomodel import db, config, install_all_labels
+import queries
+import io
+
+# models whose indexes and constraints are declared with index=True or unique_index=True
+MODELS = (Staff, Customer, Movie, Showing, Hall)
+
+# plan operators which read every node with a label, or every node, instead of using an index
+SCAN_OPERATORS = ("NodeByLabelScan", "AllNodesScan")
+
+# the lookups the app's queries start from, with placeholder parameters to plan them with
+HOT_QUERIES = (
+    ("movie by title", "MATCH (m:Movie {title: $title}) RETURN m", {"title": ""}),
+    ("showing by uuid", queries.SHOWING_SEATS, {"uuid": ""}),
+    ("showings on a date", queries.MOVIES_ON_DATE["title"],
+     {"start": 0.0, "end": 0.0, "limit": 1, "description_length": LISTING_DESCRIPTION_LENGTH + 1}),
+    ("hall schedule", queries.HALL_SCHEDULE, {"hall": 0, "start": 0.0, "end": 0.0}),
+    ("hall by name", "MATCH (h:Hall {name: $name}) RETURN h", {"name": 0}),
+    ("customer by uuid", "MATCH (c:Customer {uuid: $uuid}) RETURN c", {"uuid": ""}),
+    ("customer by username", "MATCH (c:Customer {username: $username}) RETURN c", {"username": ""}),
+    ("staff by uuid", "MATCH (st:Staff {uuid: $uuid}) RETURN st", {"uuid": ""}),
+    ("staff by username", "MATCH (st:Staff {username: $username}) RETURN st", {"username": ""}),
+)
+
+
+def session():
+    if not db.driver:
+        db.set_connection(config.DATABASE_URL)
+
+    return db.driver.session()
+
+
+def expected_schema():
+    """
+    Indexes and constraints declared on the models.
+    :return: list of (str label, str property, bool unique)
+    """
+    expected = []
+    for model in MODELS:
+        for name, prop in model.defined_properties(aliases=False, rels=False).items():
+            if prop.unique_index or prop.index:
+                expected.append((model.__label__, prop.db_property or name, bool(prop.unique_index)))
+
+    return expected
+
+
+def existing_schema():
+    """
+    Indexes in the database, including those backing uniqueness constraints.
+    :return: dict (str label, str property) -> (bool unique, str state)
+    """
+    existing = {}
+    with session() as s:
+        for record in s.run("CALL db.indexes()"):
+            index = dict(record)
+
+            # the columns of db.indexes() changed between Neo4j 3.4 and 3.5
+            labels = index.get("tokenNames") or [index.get("label")]
+            properties = index.get("properties") or []
+            if len(labels) != 1 or len(properties) != 1:
+                continue
+
+            unique = "UNIQUE" in str(index.get("type", "")).upper()
+            existing[(labels[0], properties[0])] = (unique, str(index.get("state", "")).upper())
+
+    return existing
+
+
+def install_schema():
+    """
+    Create the indexes and constraints declared on the models which don't exist yet.
+    :return: str neomodel's report of what it created
+    """
+    output = io.StringIO()
+    install_all_labels(stdout=output)
+    return output.getvalue()
+
+
+def verify_schema():
+    """
+    :return: list of str problems, e.g. missing indexes; empty if every declared index is online.
+    """
+    existing = existing_schema()
+
+    problems = []
+    for label, prop, unique in expected_schema():
+        found = existing.get((label, prop))
+        kind = "uniqueness constraint" if unique else "index"
+
+        if not found:
+            problems.append("Missing {kind} on :{label}({prop}).".format(kind=kind, label=label, prop=prop))
+        elif unique and not found[0]:
+            problems.append("Missing {kind} on :{label}({prop}); there is only an index."
+                            .format(kind=kind, label=label, prop=prop))
+        elif found[1] != "ONLINE":
+            problems.append("The {kind} on :{label}({prop}) is {state}."
+                            .format(kind=kind, label=label, prop=prop, state=found[1].lower()))
+
+    return problems
+
+
+def label_scans(queries=HOT_QUERIES):
+    """
+    EXPLAIN queries, without running them, and find the ones whose plans scan a whole label.
+    :param queries: iterable of (str name, str query, dict parameters)
+    :return: list of (str name, str operator, str label) for each scan
+    """
+    scans = []
+    with session() as s:
+        for name, query, params in queries:
+            plan = s.run("EXPLAIN " + query, params).summary().plan
+
+            operators = [plan]
+            while operators:
+                operator = operators.pop()
+
+                # newer servers suffix operators with the runtime, e.g. NodeByLabelScan@neo4j
+                if operator.operator_type.split("@")[0] in SCAN_OPERATORS:
+                    scans.append((name, operator.operator_type, operator.arguments.get("LabelName", "")))
+                operators.extend(operator.children)
+
+    return scans
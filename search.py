@@ -0,0 +1,123 @@
+from bisect import bisect_left, insort
+from models import MovieListing
+from threading import Lock
+import re
+
+WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenise(text):
+    """
+    Split text into lower case words.
+    :param text: str
+    :return: list of str
+    """
+    return WORD.findall((text or "").lower())
+
+
+class SearchIndex(object):
+    """
+    In-process inverted index over Movie titles and descriptions, matching the start of words like the old regex
+    search did. Every word of a query must match the start of some word of the movie's title or description.
+    """
+
+    # score of a word matching in the title or the description. Whole word matches score double.
+    TITLE_WEIGHT = 3
+    DESCRIPTION_WEIGHT = 1
+
+    # attributes results can be ordered by, instead of by relevance
+    ORDER_FIELDS = ("title", "duration")
+
+    def __init__(self):
+        self.documents = {}  # uuid -> MovieListing
+        self.postings = {}  # word -> {uuid: weight}
+        self.vocabulary = []  # sorted words, for prefix lookups
+        self.checked_at = None
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.documents)
+
+    def rebuild(self, movies):
+        """
+        Replace the contents of the index.
+        :param movies: iterable of Movie, or of MovieListing with whole descriptions
+        """
+        with self.lock:
+            self.documents = {}
+            self.postings = {}
+            for movie in movies:
+                self._add(movie)
+            self.vocabulary = sorted(self.postings)
+
+    def add(self, movie):
+        with self.lock:
+            new_words = self._add(movie)
+            for word in new_words:
+                insort(self.vocabulary, word)
+
+    def _add(self, movie):
+        self.documents[movie.uuid] = MovieListing.of(movie)
+
+        weights = {}
+        for word in tokenise(movie.description):
+            weights[word] = SearchIndex.DESCRIPTION_WEIGHT
+        for word in tokenise(movie.title):
+            weights[word] = SearchIndex.TITLE_WEIGHT
+
+        new_words = []
+        for word, weight in weights.items():
+            if word not in self.postings:
+                self.postings[word] = {}
+                new_words.append(word)
+            self.postings[word][movie.uuid] = weight
+
+        return new_words
+
+    def _scores(self, term):
+        """
+        Best score of each movie having a word which starts with term.
+        :param term: str
+        :return: dict uuid -> int
+        """
+        scores = {}
+        i = bisect_left(self.vocabulary, term)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(term):
+            word = self.vocabulary[i]
+            multiplier = 2 if word == term else 1
+            for uuid, weight in self.postings[word].items():
+                scores[uuid] = max(scores.get(uuid, 0), weight * multiplier)
+            i += 1
+
+        return scores
+
+    def search(self, query, order_by=None, limit=None):
+        """
+        :param query: str, an empty query matches every movie
+        :param order_by: str one of ORDER_FIELDS, or None to order by relevance
+        :param limit: int maximum number of results, or None for all of them
+        :return: list of MovieListing
+        """
+        if order_by and order_by not in SearchIndex.ORDER_FIELDS:
+            raise ValueError("Can't order search results by {o}!".format(o=order_by))
+
+        with self.lock:
+            terms = tokenise(query)
+
+            if terms:
+                # a movie must match every word in the query, and scores the sum of its best matches
+                ranked = self._scores(terms[0])
+                for term in terms[1:]:
+                    scores = self._scores(term)
+                    ranked = {uuid: score + scores[uuid] for uuid, score in ranked.items() if uuid in scores}
+            else:
+                ranked = dict.fromkeys(self.documents, 0)
+
+            movies = [(score, self.documents[uuid]) for uuid, score in ranked.items()]
+
+        if order_by:
+            movies.sort(key=lambda item: getattr(item[1], order_by))
+        else:
+            movies.sort(key=lambda item: (-item[0], item[1].title))
+
+        return [movie for score, movie in movies[:limit]]
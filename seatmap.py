@@ -0,0 +1,145 @@
+class SeatMap(object):
+    """
+    Fixed-width bitset of the reserved seats of a single Showing.
+
+    Seat numbers are 1-indexed, exactly as displayed on the hall diagram. The bits are packed into
+    WORD_BITS wide integers, so a 300 seat hall is stored as 10 integers instead of a list of up to 300.
+    """
+
+    # small enough to stay a positive 64-bit integer in Neo4j, so seats can be tested and flipped in Cypher.
+    WORD_BITS = 32
+
+    __slots__ = ("capacity", "words")
+
+    def __init__(self, capacity, words=None):
+        """
+        :param capacity: int number of seats in the hall
+        :param words: list of int, as stored in Showing.seat_words
+        """
+        self.capacity = capacity
+        self.words = list(words or [])
+
+        # pad (or trim) to the fixed width for this capacity
+        size = SeatMap.num_words(capacity)
+        self.words = self.words[:size] + [0] * (size - len(self.words))
+
+    @staticmethod
+    def num_words(capacity):
+        return -(-capacity // SeatMap.WORD_BITS)
+
+    @classmethod
+    def from_seats(cls, capacity, seats):
+        """
+        Build a seat map from a list of reserved seat numbers, i.e. the legacy Showing.reserved format.
+        :param capacity: int
+        :param seats: iterable of int
+        :return: SeatMap
+        """
+        seat_map = cls(capacity)
+        for seat in seats:
+            seat_map.reserve(int(seat))
+
+        return seat_map
+
+    @staticmethod
+    def position(seat):
+        """
+        Word index and bit mask of a seat, without checking it exists in the hall.
+        :param seat: int 1-indexed seat number
+        :return: (int, int) index into SeatMap.words, bit mask
+        """
+        index, bit = divmod(seat - 1, SeatMap.WORD_BITS)
+        return index, 1 << bit
+
+    def locate(self, seat):
+        """
+        Find the word and bit mask holding a seat.
+        :param seat: int 1-indexed seat number
+        :return: (int, int) index into self.words, bit mask
+        """
+        if not 1 <= seat <= self.capacity:
+            raise ValueError("Seat {seat} does not exist in this hall!".format(seat=seat))
+
+        return SeatMap.position(seat)
+
+    def is_reserved(self, seat):
+        index, mask = self.locate(seat)
+        return bool(self.words[index] & mask)
+
+    def reserve(self, seat):
+        index, mask = self.locate(seat)
+        self.words[index] |= mask
+
+    def release(self, seat):
+        index, mask = self.locate(seat)
+        self.words[index] &= ~mask
+
+    def best_available(self, count, rows, columns):
+        """
+        Find the best block of adjacent free seats in a row, for a hall laid out as on the hall diagram.
+        Rows nearest the middle of the hall are preferred, then the block nearest the middle of the row.
+        :param count: int number of seats wanted
+        :param rows: int
+        :param columns: int
+        :return: list of int seat numbers, or None if no row has enough adjacent free seats.
+        """
+        if not 1 <= count <= columns:
+            return None
+
+        # the whole map as a single integer, with a bit set for each free seat on the diagram
+        size = min(rows * columns, self.capacity)
+        reserved = 0
+        for index, word in enumerate(self.words):
+            reserved |= word << (index * SeatMap.WORD_BITS)
+        free = ~reserved & ((1 << size) - 1)
+
+        # bit p of runs is set if seats p .. p + count - 1 are all free; built by doubling, so O(log count)
+        runs = free
+        length = 1
+        while length < count:
+            shift = min(length, count - length)
+            runs &= runs >> shift
+            length += shift
+
+        # a block must start at least count seats before the end of its row
+        starts = (1 << (columns - count + 1)) - 1
+
+        middle_row = (rows - 1) / 2
+        middle_column = (columns - count) / 2
+        for row in sorted(range(rows), key=lambda r: abs(r - middle_row)):
+            candidates = (runs >> (row * columns)) & starts
+            best = None
+            while candidates:
+                low = candidates & -candidates
+                column = low.bit_length() - 1
+                if best is None or abs(column - middle_column) < abs(best - middle_column):
+                    best = column
+                candidates ^= low
+
+            if best is not None:
+                first = row * columns + best + 1
+                return list(range(first, first + count))
+
+        return None
+
+    @property
+    def num_reserved(self):
+        # popcount
+        return sum(bin(word).count("1") for word in self.words)
+
+    @property
+    def num_available(self):
+        return self.capacity - self.num_reserved
+
+    def __contains__(self, seat):
+        return self.is_reserved(seat)
+
+    def __iter__(self):
+        """
+        Yields reserved seat numbers in ascending order.
+        """
+        for index, word in enumerate(self.words):
+            while word:
+                low = word & -word
+                yield index * SeatMap.WORD_BITS + low.bit_length()
+                word ^= low
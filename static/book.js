@@ -1,16 +1,83 @@
 $(document).ready(function() {
-    tmp = null;
-    $(".available").on("click", function() {
-        $(this).addClass("reserved").removeClass("available")
-        seatNumber = $(this).text()
+    // seats picked on the diagram, in the order they were clicked
+    selected = []
 
-        if (tmp) {
-            tmp.removeClass("reserved").addClass("available")
+    diagram = $("table.diagram")
+
+    // picked seats are held for a few minutes so nobody else can take them, and released when unpicked
+    $(".diagram td").on("click", function() {
+        var cell = $(this)
+        var seatNumber = String(cell.data("seat"))
+
+        if (cell.hasClass("selected")) {
+            cell.removeClass("selected reserved").addClass("available")
+            selected.splice(selected.indexOf(seatNumber), 1)
+
+            if (diagram.data("release")) {
+                $.post(diagram.data("release"), {seats: seatNumber})
+            }
         }
+        else if (cell.hasClass("available")) {
+            cell.addClass("selected reserved").removeClass("available")
+            selected.push(seatNumber)
 
-        // keep track of which seat selected
-        tmp = $(this)
+            if (diagram.data("hold")) {
+                $.post(diagram.data("hold"), {seats: seatNumber}).done(function(result) {
+                    // somebody else got there first
+                    if (!result.held && selected.indexOf(seatNumber) >= 0) {
+                        selected.splice(selected.indexOf(seatNumber), 1)
+                        cell.removeClass("selected").text("R")
+                        $("#book-seat").val(selected.join(", "))
+                    }
+                }).fail(function(response) {
+                    // e.g. holding too many seats
+                    if (selected.indexOf(seatNumber) >= 0) {
+                        selected.splice(selected.indexOf(seatNumber), 1)
+                        cell.removeClass("selected reserved").addClass("available")
+                        $("#book-seat").val(selected.join(", "))
+                    }
+                    if (response.responseJSON) {
+                        alert(response.responseJSON.error)
+                    }
+                })
+            }
+        }
 
-        $("#book-seat").val(seatNumber)
+        $("#book-seat").val(selected.join(", "))
     })
-})
\ No newline at end of file
+
+    // keep the diagram up to date as seats are held, booked and cancelled by other customers
+    if (diagram.data("events") && window.EventSource) {
+        seatEvents = new EventSource(diagram.data("events"))
+
+        seatEvents.addEventListener("seats", function(e) {
+            change = JSON.parse(e.data)
+
+            change.seats.forEach(function(seat) {
+                cell = diagram.find("td[data-seat='" + seat + "']")
+
+                if (change.reserved) {
+                    // our own holds come back as reserved seats
+                    if (selected.indexOf(String(seat)) < 0) {
+                        cell.removeClass("available").addClass("reserved").text("R")
+                    }
+                }
+                else {
+                    // including our own holds, when they expire
+                    if (selected.indexOf(String(seat)) >= 0) {
+                        selected.splice(selected.indexOf(String(seat)), 1)
+                    }
+                    cell.removeClass("reserved selected").addClass("available").text(seat)
+                }
+            })
+
+            $("#book-seat").val(selected.join(", "))
+        })
+
+        // too many changes were missed to patch the diagram
+        seatEvents.addEventListener("reset", function() {
+            seatEvents.close()
+            window.location.reload()
+        })
+    }
+})
@@ -0,0 +1,832 @@
+from models import Staff, Customer, Movie, Hall, Showing, MovieListing
+from lookup import lookup, lookup_by_date, movie_showings, movie_validator, recommends, booking_details, \
+    showing_seats, book_seats, book_seats_batch, hold_seats, release_holds, expired_holds, cancel_booking, \
+    cancel_showing, record_co_bookings, user_history, export_showings, hall_capacities, hall_schedule, \
+    create_showings, index_movie, catalogue_changed, catalogue_version
+from helpers import HallSchedule, history_item, history_cursor, parse_history_cursor
+from search import SearchIndex
+from seatmap import SeatMap
+from queries import ORDER_FIELDS
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import datetime, timedelta
+from threading import RLock
+from time import time
+from pytz import utc
+import heapq
+
+
+class Storage(ABC):
+    """
+    Everything the routes read from and write to the database. Results are the same model objects and dicts
+    whichever implementation is used, so routes don't need to know which one they are talking to. Implementations
+    must define every abstract method, or they can't be instantiated.
+    """
+
+    @abstractmethod
+    def search(self, query, order_by=None, limit=None):
+        """
+        :return: list of MovieListing, see lookup.lookup()
+        """
+
+    @abstractmethod
+    def search_by_date(self, query, order_by=None, limit=None):
+        """
+        :return: list of MovieListing showing on the date in query, or matching query if it isn't a dd/mm/yy date
+        """
+
+    @abstractmethod
+    def movie_showings(self, title, limit=200):
+        """
+        :return: (Movie, list of (datetime day, list of showing dicts)), see lookup.movie_showings()
+        """
+
+    @abstractmethod
+    def movie_validator(self, title):
+        """
+        :return: (uuid, version, modified, first_start), or None, see lookup.movie_validator()
+        """
+
+    @abstractmethod
+    def recommends(self, title, limit=10):
+        """
+        :return: list of MovieListing
+        """
+
+    @abstractmethod
+    def booking_page(self, title, s_uuid):
+        """
+        :return: (Movie, Showing, Hall), or None if the movie has no such showing.
+        """
+
+    @abstractmethod
+    def showing_seats(self, s_uuid):
+        """
+        :return: SeatMap, or None
+        """
+
+    @abstractmethod
+    def book(self, title, s_uuid, c_uuid, seats):
+        """
+        Book every seat or none of them. Seats the customer holds are booked, and their holds removed.
+        :return: dict, see lookup.book_seats(), or None if the showing wasn't found.
+        """
+
+    def book_many(self, s_uuid, requests):
+        """
+        Book seats of one showing for several customers, as if book() was called for each request in turn.
+        :param requests: list of (title, customer uuid, list of seats)
+        :return: list of dict or None, as returned by book(), in the order of requests
+        """
+        return [self.book(title, s_uuid, c_uuid, seats) for title, c_uuid, seats in requests]
+
+    @abstractmethod
+    def hold(self, s_uuid, c_uuid, seats, expires, max_seats=None):
+        """
+        Hold every seat or none of them until expires, reserving them so nobody else can book them. Seats already
+        held keep their first expiry.
+        :param expires: float timestamp
+        :param max_seats: int most seats of the showing the Customer may hold at once, or None for no limit
+        :return: dict, see lookup.hold_seats(), or None if the showing wasn't found.
+        """
+
+    @abstractmethod
+    def release_holds(self, s_uuid, c_uuid, seats, before=None):
+        """
+        Free held seats.
+        :param before: float timestamp, to only release holds expiring at or before it, or None
+        :return: (list, int) seats released, Showing.version afterwards. None if the showing wasn't found.
+        """
+
+    @abstractmethod
+    def expired_holds(self, now):
+        """
+        :param now: float timestamp
+        :return: list of (showing uuid, customer uuid, seats, latest expiry) of holds which have expired
+        """
+
+    @abstractmethod
+    def cancel(self, s_uuid, c_uuid, seat):
+        """
+        Cancel a booking and free its seat.
+        :return: int Showing.version after the cancellation, or None if there was no such booking.
+        """
+
+    @abstractmethod
+    def cancel_showing(self, s_uuid):
+        """
+        Cancel a showing which can't go ahead and every booking of it, releasing its holds and freeing every seat.
+        It is no longer listed, and can't be booked or held; book(), book_many() and hold() treat it as not found.
+        :return: (dict Customer uuid -> list of int seats cancelled, list of int seats freed, int Showing.version),
+                 or None if there is no such showing or it was already cancelled.
+        """
+
+    @abstractmethod
+    def history(self, username, cursor=None, limit=25):
+        """
+        :return: (list of dict, str), see lookup.user_history()
+        """
+
+    @abstractmethod
+    def export(self):
+        """
+        :return: iterable of (title, start, num_available, num_reserved) of showings which haven't been cancelled,
+                 ordered by title and start
+        """
+
+    @abstractmethod
+    def hall(self, name):
+        """
+        :return: Hall, or None
+        """
+
+    @abstractmethod
+    def hall_capacities(self):
+        """
+        :return: dict Hall name -> number of seats
+        """
+
+    @abstractmethod
+    def hall_schedule(self, name, start, end):
+        """
+        :return: list of (start, end, title) of the showings in a hall overlapping a period, but not cancelled ones
+        """
+
+    @abstractmethod
+    def add_showings(self, staff_uuid, programme):
+        """
+        Create movies and showings, and make them visible to searches.
+        :param programme: list of dict, see importer.programme_row()
+        :return: list of Movie which were created
+        """
+
+    @abstractmethod
+    def catalogue_version(self):
+        """
+        :return: int which changes whenever movies or showings are added, or showings cancelled, so pages listing them
+                 can be cached
+        """
+
+    @abstractmethod
+    def customer(self, username):
+        """
+        :return: Customer, or None if there is no such username
+        """
+
+    @abstractmethod
+    def customer_login(self, username, password):
+        """
+        :param password: str hashed password
+        :return: Customer, or None if the username or password are wrong
+        """
+
+    @abstractmethod
+    def staff_login(self, username, password):
+        """
+        :param password: str hashed password
+        :return: Staff, or None if the username or password are wrong
+        """
+
+    @abstractmethod
+    def find_staff(self, username):
+        """
+        :return: Staff, or None if there is no such username
+        """
+
+    @abstractmethod
+    def register_customer(self, username, password, f_name, l_name):
+        """
+        :param password: str hashed password
+        :return: Customer
+        """
+
+    @abstractmethod
+    def save_customer(self, customer):
+        """
+        Store changes made to a Customer, e.g. a new password, and bring it up to date with what was stored.
+        :param customer: Customer from customer() or customer_login()
+        """
+
+    @abstractmethod
+    def create_hall(self, name, num_seats):
+        """
+        :param name: int
+        :param num_seats: int
+        :return: Hall
+        """
+
+    @abstractmethod
+    def create_staff(self, username, password, f_name, l_name):
+        """
+        :param password: str hashed password
+        :return: Staff
+        """
+
+
+class Neo4jStorage(Storage):
+    """
+    Storage in the Neo4j database configured in neomodel.config.DATABASE_URL.
+    """
+
+    def search(self, query, order_by=None, limit=None):
+        return lookup(query, order_by, limit)
+
+    def search_by_date(self, query, order_by=None, limit=None):
+        return lookup_by_date(query, order_by, limit)
+
+    def movie_showings(self, title, limit=200):
+        return movie_showings(title, limit)
+
+    def movie_validator(self, title):
+        return movie_validator(title)
+
+    def recommends(self, title, limit=10):
+        return recommends(title, limit)
+
+    def booking_page(self, title, s_uuid):
+        return booking_details(title, s_uuid)
+
+    def showing_seats(self, s_uuid):
+        return showing_seats(s_uuid)
+
+    def book(self, title, s_uuid, c_uuid, seats):
+        booking = book_seats(title, s_uuid, c_uuid, seats)
+
+        if booking and booking["booked"]:
+            record_co_bookings(s_uuid, {c_uuid: len(seats)})
+
+        return booking
+
+    def book_many(self, s_uuid, requests):
+        # book_seats_batch() checks every request against the seat map as it was before the batch, so requests
+        # claiming a seat already claimed by an earlier one are booked afterwards, on their own.
+        batch, later = [], []
+        claimed = set()
+        for i, (title, c_uuid, seats) in enumerate(requests):
+            if claimed.isdisjoint(seats):
+                claimed.update(seats)
+                batch.append(i)
+            else:
+                later.append(i)
+
+        bookings = [None] * len(requests)
+        for i, booking in zip(batch, book_seats_batch(s_uuid, [requests[i] for i in batch])):
+            bookings[i] = booking
+        for i in later:
+            bookings[i] = book_seats(requests[i][0], s_uuid, requests[i][1], requests[i][2])
+
+        deltas = Counter()
+        for (title, c_uuid, seats), booking in zip(requests, bookings):
+            if booking and booking["booked"]:
+                deltas[c_uuid] += len(seats)
+        record_co_bookings(s_uuid, deltas)
+
+        return bookings
+
+    def hold(self, s_uuid, c_uuid, seats, expires, max_seats=None):
+        return hold_seats(s_uuid, c_uuid, seats, expires, max_seats=max_seats)
+
+    def release_holds(self, s_uuid, c_uuid, seats, before=None):
+        return release_holds(s_uuid, c_uuid, seats, before)
+
+    def expired_holds(self, now):
+        return expired_holds(now)
+
+    def cancel(self, s_uuid, c_uuid, seat):
+        version = cancel_booking(s_uuid, c_uuid, seat)
+
+        if version is not None:
+            record_co_bookings(s_uuid, {c_uuid: -1})
+
+        return version
+
+    def cancel_showing(self, s_uuid):
+        cancelled = cancel_showing(s_uuid)
+        if not cancelled:
+            return None
+
+        bookings, held, version, start = cancelled
+        record_co_bookings(s_uuid, {c_uuid: -len(seats) for c_uuid, seats in bookings.items()})
+        catalogue_changed(showtimes=[start])
+
+        return bookings, sorted(set(held).union(*bookings.values())), version
+
+    def history(self, username, cursor=None, limit=25):
+        return user_history(username, cursor=cursor, limit=limit)
+
+    def export(self):
+        return export_showings()
+
+    def hall(self, name):
+        return Hall.nodes.get_or_none(name=name)
+
+    def hall_capacities(self):
+        return hall_capacities()
+
+    def hall_schedule(self, name, start, end):
+        return hall_schedule(name, start, end)
+
+    def add_showings(self, staff_uuid, programme):
+        movies = create_showings(staff_uuid, programme)
+
+        for movie in movies:
+            index_movie(movie)
+
+        showtimes = [showtime for row in programme for showtime in row["showtimes"]]
+        catalogue_changed(new_movie=bool(movies), showtimes=showtimes)
+
+        return movies
+
+    def catalogue_version(self):
+        return catalogue_version()
+
+    def customer(self, username):
+        return Customer.nodes.get_or_none(username=username)
+
+    def customer_login(self, username, password):
+        return Customer.nodes.get_or_none(username=username, password=password)
+
+    def staff_login(self, username, password):
+        return Staff.nodes.get_or_none(username=username, password=password)
+
+    def find_staff(self, username):
+        return Staff.nodes.get_or_none(username=username)
+
+    def register_customer(self, username, password, f_name, l_name):
+        return Customer(username=username, password=password, f_name=f_name, l_name=l_name).save()
+
+    def save_customer(self, customer):
+        customer.save()
+        customer.refresh()
+
+    def create_hall(self, name, num_seats):
+        return Hall(name=name, num_seats=num_seats).save()
+
+    def create_staff(self, username, password, f_name, l_name):
+        return Staff(username=username, password=password, f_name=f_name, l_name=l_name).save()
+
+
+class MemoryStorage(Storage):
+    """
+    Storage in this process's memory, indexed for every operation the routes use, giving the same results as
+    Neo4jStorage. Nothing is persisted; it is for benchmarking the app on its own and load testing without a database.
+    """
+
+    def __init__(self):
+        self.lock = RLock()
+        self.search_index = SearchIndex()
+
+        self.movies = {}  # title -> Movie
+        self.movies_by_uuid = {}
+        self.listings = {}  # Movie uuid -> MovieListing
+        self.catalogue_changes = 0  # incremented whenever movies or showings are added, or showings cancelled
+        self.halls = {}  # name -> Hall
+        self.schedules = {}  # Hall name -> HallSchedule
+        self.staff = {}  # username -> Staff
+        self.staff_by_uuid = {}
+        self.customers = {}  # username -> Customer
+        self.customers_by_uuid = {}
+
+        self.showings = {}  # uuid -> Showing
+        self.seat_maps = {}  # Showing uuid -> SeatMap sharing its words with Showing.seat_words
+        self.showing_movie = {}  # Showing uuid -> Movie
+        self.showing_hall = {}  # Showing uuid -> Hall
+        self.movie_starts = {}  # Movie uuid -> sorted list of (start, Showing uuid)
+        self.showings_by_day = {}  # timestamp of UTC midnight -> list of Showing starting that day
+
+        self.bookings = {}  # Customer uuid -> list of booking dicts, ordered by (time, id)
+        self.booking_keys = {}  # Customer uuid -> list of (time, id), for keyset pagination
+        self.live_bookings = {}  # (Customer uuid, Showing uuid, seat) -> booking dict
+        self.holds = {}  # (Customer uuid, Showing uuid) -> {seat: expiry timestamp}
+        self.next_booking_id = 0
+
+        self.booked_movies = {}  # Customer uuid -> Counter of live bookings per Movie uuid
+        self.co_bookings = {}  # Movie uuid -> Counter of co-bookings per Movie uuid
+
+    def search(self, query, order_by=None, limit=None):
+        return self.search_index.search(query, order_by=order_by, limit=limit)
+
+    def search_by_date(self, query, order_by=None, limit=None):
+        try:
+            day = datetime.strptime(query, "%d/%m/%y").replace(tzinfo=utc)
+        except ValueError:
+            return self.search(query, order_by, limit)
+
+        if order_by and order_by not in ORDER_FIELDS:
+            raise ValueError("Can't order search results by {o}!".format(o=order_by))
+
+        end = day + timedelta(hours=24)
+        with self.lock:
+            movies = {self.showing_movie[showing.uuid].uuid for showing in self.showings_by_day.get(day.timestamp(), [])
+                      if showing.end < end and not showing.cancelled}
+            movies = [self.listings[uuid] for uuid in movies]
+
+        field = order_by or "title"
+        return sorted(movies, key=lambda movie: (getattr(movie, field), movie.title))[:limit]
+
+    def movie_showings(self, title, limit=200):
+        with self.lock:
+            movie = self.movies.get(title)
+            if not movie:
+                return None
+
+            now = datetime.now(tz=utc)
+            starts = self.movie_starts[movie.uuid]
+
+            days = []
+            for start, uuid in starts[bisect_right(starts, (now, "￿")):]:
+                showing = self.showings[uuid]
+                if showing.num_available <= 0 or showing.cancelled:
+                    continue
+
+                day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+                show = {"uuid": uuid, "start": start, "num_available": showing.num_available}
+                if days and days[-1][0] == day:
+                    days[-1][1].append(show)
+                else:
+                    days.append((day, [show]))
+
+                limit -= 1
+                if not limit:
+                    break
+
+        return movie, days
+
+    def movie_validator(self, title):
+        with self.lock:
+            movie = self.movies.get(title)
+            if not movie:
+                return None
+
+            now = datetime.now(tz=utc)
+            starts = self.movie_starts[movie.uuid]
+
+            first_start = None
+            for start, uuid in starts[bisect_right(starts, (now, "￿")):]:
+                showing = self.showings[uuid]
+                if showing.num_available > 0 and not showing.cancelled:
+                    first_start = start
+                    break
+
+            return movie.uuid, movie.version, movie.modified, first_start
+
+    def recommends(self, title, limit=10):
+        with self.lock:
+            movie = self.movies.get(title)
+            if not movie:
+                return []
+
+            counts = self.co_bookings.get(movie.uuid, {})
+            best = heapq.nsmallest(limit, ((-count, self.movies_by_uuid[uuid].title, uuid)
+                                           for uuid, count in counts.items() if count > 0))
+
+        return [self.listings[uuid] for count, title, uuid in best]
+
+    def booking_page(self, title, s_uuid):
+        with self.lock:
+            showing = self.showings.get(s_uuid)
+            if not showing or self.showing_movie[s_uuid].title != title:
+                return None
+
+            return self.showing_movie[s_uuid], showing, self.showing_hall[s_uuid]
+
+    def showing_seats(self, s_uuid):
+        with self.lock:
+            seat_map = self.seat_maps.get(s_uuid)
+            return SeatMap(seat_map.capacity, seat_map.words) if seat_map else None
+
+    def book(self, title, s_uuid, c_uuid, seats):
+        with self.lock:
+            showing = self.showings.get(s_uuid)
+            customer = self.customers_by_uuid.get(c_uuid)
+            if not showing or showing.cancelled or not customer or self.showing_movie[s_uuid].title != title:
+                return None
+
+            movie = self.showing_movie[s_uuid]
+            seat_map = self.seat_maps[s_uuid]
+            held = self.holds.get((c_uuid, s_uuid), {})
+
+            fresh = [seat for seat in seats if seat not in held]
+            taken = [seat for seat in fresh if not 1 <= seat <= seat_map.capacity or seat in seat_map]
+            if not taken:
+                now = time()
+                for seat in fresh:
+                    seat_map.reserve(seat)
+                for seat in seats:
+                    held.pop(seat, None)
+                    self._add_booking(customer, showing, seat, now)
+
+                if not held:
+                    self.holds.pop((c_uuid, s_uuid), None)
+
+                showing.num_available -= len(fresh)
+                showing.version += 1
+                movie.version += 1
+                movie.modified = datetime.fromtimestamp(now, tz=utc)
+
+                self._co_book(c_uuid, movie.uuid, len(seats))
+
+            return {
+                "booked": not taken,
+                "taken": taken,
+                "capacity": seat_map.capacity,
+                "version": showing.version,
+                "name": " ".join([customer.f_name, customer.l_name]),
+                "duration": movie.duration,
+                "hall": self.showing_hall[s_uuid].name,
+                "start": showing.start
+            }
+
+    def hold(self, s_uuid, c_uuid, seats, expires, max_seats=None):
+        with self.lock:
+            showing = self.showings.get(s_uuid)
+            if not showing or showing.cancelled or c_uuid not in self.customers_by_uuid:
+                return None
+
+            movie = self.showing_movie[s_uuid]
+            seat_map = self.seat_maps[s_uuid]
+            held = self.holds.get((c_uuid, s_uuid), {})
+
+            fresh = [seat for seat in seats if seat not in held]
+            taken = [seat for seat in fresh if not 1 <= seat <= seat_map.capacity or seat in seat_map]
+            limited = max_seats is not None and len(held) + len(fresh) > max_seats
+            if not taken and not limited and fresh:
+                for seat in fresh:
+                    held[seat] = expires
+                    seat_map.reserve(seat)
+                self.holds[(c_uuid, s_uuid)] = held
+
+                showing.num_available -= len(fresh)
+                showing.version += 1
+                movie.version += 1
+                movie.modified = datetime.now(tz=utc)
+
+            return {"held": not taken and not limited, "taken": taken, "capacity": seat_map.capacity,
+                    "version": showing.version, "seats": fresh if not taken and not limited else [],
+                    "limited": limited}
+
+    def release_holds(self, s_uuid, c_uuid, seats, before=None):
+        with self.lock:
+            showing = self.showings.get(s_uuid)
+            if not showing:
+                return None
+
+            held = self.holds.get((c_uuid, s_uuid), {})
+            released = sorted(seat for seat in set(seats) if seat in held and (before is None or held[seat] <= before))
+            if released:
+                for seat in released:
+                    del held[seat]
+                    self.seat_maps[s_uuid].release(seat)
+
+                movie = self.showing_movie[s_uuid]
+                showing.num_available += len(released)
+                showing.version += 1
+                movie.version += 1
+                movie.modified = datetime.now(tz=utc)
+
+            if not held:
+                self.holds.pop((c_uuid, s_uuid), None)
+
+            return released, showing.version
+
+    def expired_holds(self, now):
+        with self.lock:
+            expired = []
+            for (c_uuid, s_uuid), held in self.holds.items():
+                seats = [seat for seat, expires in held.items() if expires <= now]
+                if seats:
+                    expired.append((s_uuid, c_uuid, seats, max(held[seat] for seat in seats)))
+
+            return expired
+
+    def _add_booking(self, customer, showing, seat, now):
+        booking = {"id": self.next_booking_id, "time": now, "seat": seat, "showing": showing, "cancelled": False,
+                   "cancelled_time": None}
+        self.next_booking_id += 1
+
+        bookings = self.bookings.setdefault(customer.uuid, [])
+        keys = self.booking_keys.setdefault(customer.uuid, [])
+        key = (booking["time"], booking["id"])
+        i = bisect_right(keys, key)
+        keys.insert(i, key)
+        bookings.insert(i, booking)
+
+        self.live_bookings[(customer.uuid, showing.uuid, seat)] = booking
+
+    def _co_book(self, c_uuid, m_uuid, delta):
+        """
+        Update co-booking counts like lookup.record_co_bookings().
+        """
+        booked = self.booked_movies.setdefault(c_uuid, Counter())
+        for other, count in booked.items():
+            if other != m_uuid and count:
+                self.co_bookings.setdefault(m_uuid, Counter())[other] += delta * count
+                self.co_bookings.setdefault(other, Counter())[m_uuid] += delta * count
+
+        booked[m_uuid] += delta
+
+    def cancel(self, s_uuid, c_uuid, seat):
+        with self.lock:
+            booking = self.live_bookings.pop((c_uuid, s_uuid, seat), None)
+            if not booking:
+                return None
+
+            now = time()
+            booking["cancelled"] = True
+            booking["cancelled_time"] = now
+
+            showing = self.showings[s_uuid]
+            movie = self.showing_movie[s_uuid]
+            self.seat_maps[s_uuid].release(seat)
+            showing.num_available += 1
+            showing.version += 1
+            movie.version += 1
+            movie.modified = datetime.fromtimestamp(now, tz=utc)
+
+            self._co_book(c_uuid, movie.uuid, -1)
+
+            return showing.version
+
+    def cancel_showing(self, s_uuid):
+        with self.lock:
+            showing = self.showings.get(s_uuid)
+            if not showing or showing.cancelled:
+                return None
+
+            now = time()
+            bookings = {}
+            for key in [key for key in self.live_bookings if key[1] == s_uuid]:
+                booking = self.live_bookings.pop(key)
+                booking["cancelled"] = True
+                booking["cancelled_time"] = now
+                bookings.setdefault(key[0], []).append(key[2])
+
+            held = []
+            for key in [key for key in self.holds if key[1] == s_uuid]:
+                held.extend(self.holds.pop(key))
+
+            movie = self.showing_movie[s_uuid]
+            seat_map = self.seat_maps[s_uuid]
+            for seat in held + [seat for seats in bookings.values() for seat in seats]:
+                seat_map.release(seat)
+            showing.num_available = 0
+            showing.cancelled = True
+            self.schedules[self.showing_hall[s_uuid].name].remove(showing.start, showing.end, movie.title)
+            showing.version += 1
+            movie.version += 1
+            movie.modified = datetime.fromtimestamp(now, tz=utc)
+            self.catalogue_changes += 1
+
+            for c_uuid, seats in bookings.items():
+                self._co_book(c_uuid, movie.uuid, -len(seats))
+
+            return bookings, sorted(set(held).union(*bookings.values())), showing.version
+
+    def history(self, username, cursor=None, limit=25):
+        time_before, id_before = parse_history_cursor(cursor)
+
+        with self.lock:
+            customer = self.customers.get(username)
+            if not customer:
+                return [], None
+
+            bookings = self.bookings.get(customer.uuid, [])
+            keys = self.booking_keys.get(customer.uuid, [])
+
+            end = bisect_left(keys, (time_before, id_before)) if time_before is not None else len(bookings)
+            page = bookings[max(0, end - limit - 1):end][::-1]
+
+            next_cursor = None
+            if len(page) > limit:
+                page = page[:limit]
+                next_cursor = history_cursor(page[-1]["time"], page[-1]["id"])
+
+            now = datetime.now(tz=utc)
+            items = [history_item(booking["time"], self.showing_movie[booking["showing"].uuid].title, booking["seat"],
+                                  booking["showing"].start.timestamp(), booking["showing"].uuid,
+                                  booking["cancelled"], booking["cancelled_time"], booking["showing"].start < now)
+                     for booking in page]
+
+        return items, next_cursor
+
+    def export(self):
+        with self.lock:
+            titles = sorted(self.movies)
+
+        for title in titles:
+            with self.lock:
+                movie = self.movies[title]
+                rows = [(title, start, self.showings[uuid].num_available,
+                         self.showings[uuid].capacity - self.showings[uuid].num_available)
+                        for start, uuid in self.movie_starts[movie.uuid] if not self.showings[uuid].cancelled]
+
+            for row in rows:
+                yield row
+
+    def hall(self, name):
+        return self.halls.get(name)
+
+    def hall_capacities(self):
+        with self.lock:
+            return {name: hall.num_seats for name, hall in self.halls.items()}
+
+    def hall_schedule(self, name, start, end):
+        with self.lock:
+            schedule = self.schedules.get(name)
+            return schedule.overlapping(start, end) if schedule else []
+
+    def add_showings(self, staff_uuid, programme):
+        created = []
+
+        with self.lock:
+            if staff_uuid not in self.staff_by_uuid:
+                return created
+
+            now = datetime.now(tz=utc)
+            for row in programme:
+                hall = self.halls.get(row["hall"])
+                if not hall:
+                    continue
+
+                movie = self.movies.get(row["title"])
+                if not movie:
+                    movie = Movie(uuid=row["uuid"], title=row["title"], description=row["description"],
+                                  duration=row["duration"])
+                    self.movies[movie.title] = movie
+                    self.movies_by_uuid[movie.uuid] = movie
+                    self.listings[movie.uuid] = MovieListing.of(movie)
+                    self.movie_starts[movie.uuid] = []
+                    self.search_index.add(movie)
+                    created.append(movie)
+
+                movie.version += 1
+                movie.modified = now
+
+                for show in row["showings"]:
+                    showing = Showing(uuid=show["uuid"], start=datetime.fromtimestamp(show["start"], tz=utc),
+                                      end=datetime.fromtimestamp(show["end"], tz=utc))
+                    seat_map = SeatMap(hall.num_seats, show["seat_words"])
+                    showing.seats = seat_map
+
+                    self.showings[showing.uuid] = showing
+                    self.seat_maps[showing.uuid] = seat_map
+                    self.showing_movie[showing.uuid] = movie
+                    self.showing_hall[showing.uuid] = hall
+                    insort(self.movie_starts[movie.uuid], (showing.start, showing.uuid))
+
+                    day = showing.start.replace(hour=0, minute=0, second=0, microsecond=0)
+                    self.showings_by_day.setdefault(day.timestamp(), []).append(showing)
+                    self.schedules[hall.name].add(showing.start, showing.end, movie.title)
+
+            self.catalogue_changes += 1
+
+        return created
+
+    def catalogue_version(self):
+        return self.catalogue_changes
+
+    def customer(self, username):
+        return self.customers.get(username)
+
+    def customer_login(self, username, password):
+        customer = self.customers.get(username)
+        return customer if customer and customer.password == password else None
+
+    def staff_login(self, username, password):
+        staff = self.staff.get(username)
+        return staff if staff and staff.password == password else None
+
+    def find_staff(self, username):
+        return self.staff.get(username)
+
+    def register_customer(self, username, password, f_name, l_name):
+        customer = Customer(username=username, password=password, f_name=f_name, l_name=l_name)
+
+        with self.lock:
+            self.customers[username] = customer
+            self.customers_by_uuid[customer.uuid] = customer
+
+        return customer
+
+    def save_customer(self, customer):
+        # customers are held by reference, so changes are already saved.
+        pass
+
+    def create_hall(self, name, num_seats):
+        hall = Hall(name=name, num_seats=num_seats)
+
+        with self.lock:
+            self.halls[name] = hall
+            self.schedules[name] = HallSchedule([])
+
+        return hall
+
+    def create_staff(self, username, password, f_name, l_name):
+        staff = Staff(username=username, password=password, f_name=f_name, l_name=l_name)
+
+        with self.lock:
+            self.staff[username] = staff
+            self.staff_by_uuid[staff.uuid] = staff
+
+        return staff